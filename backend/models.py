@@ -7,9 +7,37 @@ from enum import Enum
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
+import os
 import uuid
 import random
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _flip_metrics_kernel(asking, transport, market, mult, profit, roi, flip):
+        # Loop form instead of ufunc calls: Numba auto-vectorizes the
+        # scalar clamps and prange spreads rows across threads, GIL-free
+        for i in prange(asking.shape[0]):
+            m = market[i]
+            if m <= 0.0:
+                m = round(asking[i] * mult[i], 2)
+                market[i] = m
+            p = m - asking[i] - transport[i]
+            profit[i] = p
+            r = p / asking[i] * 100.0 if asking[i] > 0.0 else 0.0
+            roi[i] = r
+            profit_score = min(max(p / 5000.0, 0.0), 5.0)
+            roi_score = min(max(r / 10.0, 0.0), 5.0)
+            flip[i] = round(profit_score + roi_score, 1)
+else:
+    _flip_metrics_kernel = None
+
 class SellerType(str, Enum):
     PRIVATE = "private"
     DEALER = "dealer"
@@ -65,9 +93,29 @@ class ListingStatus(str, Enum):
     SOLD = "sold"
     PASSED = "passed"
 
+# Each uuid4() call issues its own getrandom syscall; drawing ids from
+# a bulk-filled entropy pool amortizes that across 1024 ids per refill
+# Module-level alias skips the class attribute lookup on every
+# default_factory invocation
+_utcnow = datetime.utcnow
+
+_UUID_POOL_SIZE = 16 * 1024
+_uuid_pool = b''
+_uuid_pool_offset = _UUID_POOL_SIZE
+
+def _next_id() -> str:
+    """Generate a uuid4 string from the shared entropy pool"""
+    global _uuid_pool, _uuid_pool_offset
+    if _uuid_pool_offset >= _UUID_POOL_SIZE:
+        _uuid_pool = os.urandom(_UUID_POOL_SIZE)
+        _uuid_pool_offset = 0
+    raw = _uuid_pool[_uuid_pool_offset:_uuid_pool_offset + 16]
+    _uuid_pool_offset += 16
+    return str(uuid.UUID(bytes=raw, version=4))
+
 # Pydantic Models
 class Vehicle(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_next_id)
     vin: Optional[str] = None
     make: str
     model: str
@@ -83,7 +131,7 @@ class Vehicle(BaseModel):
     source: Source
     url: str
     date_listed: Optional[datetime] = None
-    scraped_at: datetime = Field(default_factory=datetime.utcnow)
+    scraped_at: datetime = Field(default_factory=_utcnow)
     transport_cost: Optional[float] = None
     est_profit: Optional[float] = None
     roi_percent: Optional[float] = None
@@ -92,26 +140,117 @@ class Vehicle(BaseModel):
     notes: Optional[str] = None
     images: List[str] = Field(default_factory=list)
 
+def add_normalized_fields(doc: dict) -> dict:
+    """Attach lowercased make_lc/model_lc to a vehicle document
+
+    Queries filter on these normalized fields with a case-sensitive
+    anchored prefix regex, which Mongo can serve from an index range;
+    the "$options": "i" flag they replace defeats prefix optimization.
+    """
+    make = doc.get("make")
+    model = doc.get("model")
+    doc["make_lc"] = make.lower() if make else None
+    doc["model_lc"] = model.lower() if model else None
+    return doc
+
 # Helper Functions
-def calculate_market_metrics(vehicle: Vehicle) -> Vehicle:
-    """Calculate market value, profit, ROI, and flip score for a vehicle"""
-    if not vehicle.market_value:
+def calculate_market_metrics(vehicle: dict) -> dict:
+    """Calculate market value, profit, ROI, and flip score in place
+
+    Operates on a plain vehicle document; dict item access is cheaper
+    than BaseModel attribute dispatch and callers construct a Vehicle
+    only at the boundary where one is actually needed.
+    """
+    asking_price = vehicle["asking_price"]
+    market_value = vehicle.get("market_value")
+    if not market_value:
         # Mock market value calculation (in real app, this would use ML/market data)
-        base_value = vehicle.asking_price * random.uniform(0.9, 1.3)
-        vehicle.market_value = round(base_value, 2)
-    
+        market_value = round(asking_price * random.uniform(0.9, 1.3), 2)
+        vehicle["market_value"] = market_value
+
     # Calculate estimated profit
-    if vehicle.market_value:
-        transport_cost = vehicle.transport_cost or 0
-        vehicle.est_profit = vehicle.market_value - vehicle.asking_price - transport_cost
-        
-        # Calculate ROI percentage
-        if vehicle.asking_price > 0:
-            vehicle.roi_percent = (vehicle.est_profit / vehicle.asking_price) * 100
-        
-        # Calculate flip score (0-10 scale)
-        profit_score = min(vehicle.est_profit / 5000, 5) if vehicle.est_profit > 0 else 0
-        roi_score = min(vehicle.roi_percent / 10, 5) if vehicle.roi_percent and vehicle.roi_percent > 0 else 0
-        vehicle.flip_score = round(profit_score + roi_score, 1)
-    
+    transport_cost = vehicle.get("transport_cost") or 0
+    est_profit = market_value - asking_price - transport_cost
+    vehicle["est_profit"] = est_profit
+
+    # Calculate ROI percentage
+    roi_percent = vehicle.get("roi_percent")
+    if asking_price > 0:
+        roi_percent = (est_profit / asking_price) * 100
+        vehicle["roi_percent"] = roi_percent
+
+    # Calculate flip score (0-10 scale)
+    profit_score = min(est_profit / 5000, 5) if est_profit > 0 else 0
+    roi_score = min(roi_percent / 10, 5) if roi_percent and roi_percent > 0 else 0
+    vehicle["flip_score"] = round(profit_score + roi_score, 1)
+
     return vehicle
+
+def calculate_market_metrics_batch(vehicles: List[Vehicle]) -> List[Vehicle]:
+    """Vectorized calculate_market_metrics for a batch of vehicles
+
+    Post-scrape batches run to hundreds of vehicles; computing the
+    metrics as a handful of NumPy ufunc calls replaces one Python-level
+    pass per vehicle. Semantics match calculate_market_metrics.
+    """
+    if not vehicles:
+        return vehicles
+
+    asking = np.array([v.asking_price for v in vehicles], dtype=np.float64)
+    transport = np.array([v.transport_cost or 0.0 for v in vehicles], dtype=np.float64)
+    market = np.array([v.market_value or 0.0 for v in vehicles], dtype=np.float64)
+
+    market, profit, roi, flip = _metric_arrays(asking, transport, market)
+
+    for vehicle, m, p, r, f in zip(vehicles, market, profit, roi, flip):
+        vehicle.market_value = float(m)
+        vehicle.est_profit = float(p)
+        vehicle.roi_percent = float(r)
+        vehicle.flip_score = float(f)
+
+    return vehicles
+
+def calculate_market_metrics_batch_dicts(docs: List[dict]) -> List[dict]:
+    """Vectorized calculate_market_metrics for a batch of documents
+
+    Same math as calculate_market_metrics_batch but over the plain
+    dicts the scrape response path works with.
+    """
+    if not docs:
+        return docs
+
+    asking = np.array([d.get("asking_price") or 0.0 for d in docs], dtype=np.float64)
+    transport = np.array([d.get("transport_cost") or 0.0 for d in docs], dtype=np.float64)
+    market = np.array([d.get("market_value") or 0.0 for d in docs], dtype=np.float64)
+
+    market, profit, roi, flip = _metric_arrays(asking, transport, market)
+
+    for doc, m, p, r, f in zip(docs, market, profit, roi, flip):
+        doc["market_value"] = float(m)
+        doc["est_profit"] = float(p)
+        doc["roi_percent"] = float(r)
+        doc["flip_score"] = float(f)
+
+    return docs
+
+def _metric_arrays(asking, transport, market):
+    """Run the metric math on aligned arrays; returns the new columns"""
+    n = asking.shape[0]
+
+    # Mock market-value multiplier where the value is missing (same
+    # placeholder model as the scalar version)
+    mult = np.random.uniform(0.9, 1.3, n)
+
+    if _flip_metrics_kernel is not None:
+        profit = np.empty(n)
+        roi = np.empty(n)
+        flip = np.empty(n)
+        _flip_metrics_kernel(asking, transport, market, mult, profit, roi, flip)
+    else:
+        market = np.where(market > 0, market, np.round(asking * mult, 2))
+        profit = market - asking - transport
+        safe_asking = np.where(asking > 0, asking, 1.0)
+        roi = np.where(asking > 0, profit / safe_asking * 100, 0.0)
+        flip = np.round(np.clip(profit / 5000, 0, 5) + np.clip(roi / 10, 0, 5), 1)
+
+    return market, profit, roi, flip
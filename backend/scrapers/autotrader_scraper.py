@@ -3,11 +3,11 @@ AutoTrader Scraper for FlipBot AI
 Scrapes vehicle listings from AutoTrader.com
 """
 
+import asyncio
 import logging
-import re
 from typing import List, Optional
-from urllib.parse import urlencode, urlparse, parse_qs, urljoin
-from bs4 import BeautifulSoup
+from urllib.parse import urlencode, urlparse, parse_qs
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .base_scraper import BaseScraper, VehicleData
 from ..models import Source, SellerType
@@ -16,50 +16,56 @@ logger = logging.getLogger(__name__)
 
 class AutoTraderScraper(BaseScraper):
     """AutoTrader.com vehicle scraper"""
-    
+
+    # Matches numRecords in get_search_url
+    PAGE_SIZE = 100
+
+    # AutoTrader-specific selectors
+    SELECTORS = {
+        'listings': (
+            '[data-cmp="inventoryListing"]',
+            '.inventory-listing',
+            '.atc-listing-card',
+            '.listing-container'
+        ),
+        'title': (
+            '[data-cmp="inventoryListingTitle"]',
+            '.listing-title',
+            '.heading-3',
+            'h3'
+        ),
+        'price': (
+            '[data-cmp="inventoryListingPrice"]',
+            '.first-price',
+            '.listing-price',
+            '.price-section'
+        ),
+        'mileage': (
+            '[data-cmp="inventoryListingMileage"]',
+            '.listing-mileage',
+            '.odometer-display'
+        ),
+        'location': (
+            '[data-cmp="inventoryListingLocation"]',
+            '.listing-location',
+            '.dealer-distance'
+        ),
+        'dealer_type': (
+            '.listing-dealer-type',
+            '.seller-type'
+        ),
+        'listing_url': (
+            'a[href*="/cars-for-sale/"]',
+            '.listing-title-link'
+        )
+    }
+
     def __init__(self):
         super().__init__(Source.AUTOTRADER)
         self.base_url = "https://www.autotrader.com"
         
-        # AutoTrader-specific selectors
-        self.selectors = {
-            'listings': [
-                '[data-cmp="inventoryListing"]',
-                '.inventory-listing',
-                '.atc-listing-card',
-                '.listing-container'
-            ],
-            'title': [
-                '[data-cmp="inventoryListingTitle"]',
-                '.listing-title',
-                '.heading-3',
-                'h3'
-            ],
-            'price': [
-                '[data-cmp="inventoryListingPrice"]',
-                '.first-price',
-                '.listing-price',
-                '.price-section'
-            ],
-            'mileage': [
-                '[data-cmp="inventoryListingMileage"]',
-                '.listing-mileage',
-                '.odometer-display'
-            ],
-            'location': [
-                '[data-cmp="inventoryListingLocation"]',
-                '.listing-location',
-                '.dealer-distance'
-            ],
-            'dealer_type': [
-                '.listing-dealer-type',
-                '.seller-type'
-            ],
-            'listing_url': [
-                'a[href*="/cars-for-sale/"]',
-                '.listing-title-link'
-            ]
-        }
+        # Only parse listing containers - skips nav/footer subtrees entirely
+        self.listing_strainer = SoupStrainer(attrs={'data-cmp': 'inventoryListing'})
     
     def get_search_url(self, query: str, location: str = "") -> str:
         """Generate AutoTrader search URL"""
@@ -92,88 +98,98 @@ class AutoTraderScraper(BaseScraper):
         
         return f"{self.base_url}/cars-for-sale/all-cars?" + urlencode(params)
     
-    async def scrape_search_results(self, query: str, location: str = "", 
+    async def scrape_search_results(self, query: str, location: str = "",
                                    max_results: int = 50) -> List[VehicleData]:
         """Scrape AutoTrader search results"""
         vehicles = []
-        
+
         try:
-            search_url = self.get_search_url(query, location)
-            logger.info(f"Scraping AutoTrader: {search_url}")
-            
-            # Use browser for dynamic content
-            html = await self.get_with_retry(search_url, use_browser=True)
-            if not html:
-                logger.error("Failed to get AutoTrader HTML")
-                return vehicles
-            
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Find listing containers with fallback selectors
-            listing_elements = []
-            for selector in self.selectors['listings']:
-                listing_elements = soup.select(selector)
-                if listing_elements:
-                    logger.info(f"Found {len(listing_elements)} listings with selector: {selector}")
-                    break
-            
-            if not listing_elements:
-                logger.warning("No listings found on AutoTrader")
-                return vehicles
-            
-            # Process each listing
-            for i, listing in enumerate(listing_elements[:max_results]):
-                try:
-                    vehicle = await self._parse_listing(listing, soup)
-                    if vehicle and vehicle.asking_price:
-                        vehicles.append(vehicle)
-                        logger.debug(f"Parsed vehicle {i+1}: {vehicle.year} {vehicle.make} {vehicle.model}")
-                except Exception as e:
-                    logger.error(f"Error parsing listing {i+1}: {e}")
+            # One URL per result page via firstRecord pagination
+            num_pages = max(1, -(-max_results // self.PAGE_SIZE))
+            search_url = self.cached_search_url(query, location)
+            urls = [search_url] + [
+                f"{search_url}&firstRecord={page * self.PAGE_SIZE}"
+                for page in range(1, num_pages)
+            ]
+            logger.info(f"Scraping AutoTrader: {search_url} ({num_pages} page(s))")
+
+            # Fetch pages concurrently so wall time is the slowest page,
+            # not the sum of all pages
+            semaphore = asyncio.Semaphore(5)
+
+            async def fetch(url: str) -> Optional[str]:
+                async with semaphore:
+                    return await self.fetch_listing_page(url)
+
+            pages = await asyncio.gather(*(fetch(url) for url in urls))
+
+            for html in pages:
+                if not html:
+                    logger.error("Failed to get AutoTrader HTML")
                     continue
-            
+
+                listing_elements = self._find_listings(html)
+                if not listing_elements:
+                    logger.warning("No listings found on AutoTrader")
+                    continue
+
+                # Process each listing
+                for i, listing in enumerate(listing_elements):
+                    if len(vehicles) >= max_results:
+                        break
+                    try:
+                        vehicle = self._parse_listing(listing)
+                        if vehicle and vehicle.asking_price:
+                            vehicles.append(vehicle)
+                            logger.debug("Parsed vehicle %d: %s %s %s", i + 1, vehicle.year, vehicle.make, vehicle.model)
+                    except Exception as e:
+                        logger.error(f"Error parsing listing {i+1}: {e}")
+                        continue
+
             logger.info(f"Successfully scraped {len(vehicles)} vehicles from AutoTrader")
-            
+
         except Exception as e:
             logger.error(f"AutoTrader scraping failed: {e}")
-        
+
         return vehicles
+
+    def _find_listings(self, html: str) -> List:
+        """Parse a result page and locate the listing containers"""
+        # Restrict parsing to listing containers; fall back to a full
+        # parse if the strained tree comes up empty (page layout changed)
+        soup = BeautifulSoup(html, 'lxml', parse_only=self.listing_strainer)
+
+        for attempt_soup in (soup, None):
+            if attempt_soup is None:
+                attempt_soup = BeautifulSoup(html, 'lxml')
+            for selector in self.selectors['listings']:
+                listing_elements = attempt_soup.select(selector)
+                if listing_elements:
+                    logger.info(f"Found {len(listing_elements)} listings with selector: {selector}")
+                    return listing_elements
+        return []
     
-    async def _parse_listing(self, listing_element, full_soup: BeautifulSoup) -> Optional[VehicleData]:
+    def _parse_listing(self, listing_element) -> Optional[VehicleData]:
         """Parse individual vehicle listing"""
         vehicle = VehicleData()
         vehicle.source = Source.AUTOTRADER
         
         try:
-            # Extract title/vehicle info
-            title_text = self.extract_with_fallback(listing_element, self.selectors['title'])
-            if title_text:
-                year, make, model = self.extract_year_make_model(title_text)
-                vehicle.year = year
-                vehicle.make = make
-                vehicle.model = model
-            
-            # Extract price
-            price_text = self.extract_with_fallback(listing_element, self.selectors['price'])
-            vehicle.asking_price = self.clean_price(price_text)
-            
-            # Extract mileage
-            mileage_text = self.extract_with_fallback(listing_element, self.selectors['mileage'])
-            vehicle.mileage = self.clean_mileage(mileage_text)
-            
-            # Extract location
-            location_text = self.extract_with_fallback(listing_element, self.selectors['location'])
-            if location_text:
-                vehicle.location = location_text
-                vehicle.zip_code = self.extract_zip_code(location_text)
-            
+            # Extract all fields in a single pass over the listing subtree
+            fields = self.extract_fields(
+                listing_element, ('title', 'price', 'mileage', 'location', 'dealer_type'))
+
+            self.apply_listing_fields(
+                vehicle, fields['title'], fields['price'],
+                fields['mileage'], fields['location'])
+
             # Extract listing URL
-            url_element = listing_element.select_one('a[href*="/cars-for-sale/"]')
-            if url_element and url_element.get('href'):
-                vehicle.url = urljoin(self.base_url, url_element['href'])
-            
+            href = self.find_listing_href(listing_element, '/cars-for-sale/')
+            if href:
+                vehicle.url = self.join_url(href)
+
             # Determine seller type (default to dealer for AutoTrader)
-            dealer_type_text = self.extract_with_fallback(listing_element, self.selectors['dealer_type'])
+            dealer_type_text = fields['dealer_type']
             if dealer_type_text and 'private' in dealer_type_text.lower():
                 vehicle.seller_type = SellerType.PRIVATE
             else:
@@ -4,115 +4,362 @@ Provides common functionality for all vehicle scrapers
 """
 
 import asyncio
+import functools
 import logging
-import random
 import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any
+from dataclasses import dataclass, field as dataclass_field
+from typing import ClassVar, List, Dict, Optional, Any
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 import re
 
-import aiohttp
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 from fake_useragent import UserAgent
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import async_playwright, Browser
 import httpx
 
 from ..models import Source, SellerType
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for the per-listing cleanup helpers; hot enough
+# that even re's internal cache lookup is worth skipping
+_DIGITS_RE = re.compile(r'\d+')
+# Anchoring the year to 19xx/20xx lets a single search() skip any
+# "Used"/"New"/"Certified" prefix instead of stripping prefixes first
+_YMM_RE = re.compile(
+    r'(?P<year>(?:19|20)\d{2})\s+(?P<make>[A-Za-z\-]+)\s+(?P<model>[^|,/]+)')
+_ZIP_RE = re.compile(r'\b\d{5}\b')
+
+class _KeepDigitsAndDot(dict):
+    """str.translate table that keeps digits and '.', deletes everything else"""
+
+    def __missing__(self, code):
+        return None
+
+_PRICE_TABLE = _KeepDigitsAndDot({ord(c): c for c in '0123456789.'})
+
+# fake_useragent loads and parses its UA database on construction;
+# build it once per process instead of once per scraper
+_SHARED_UA = UserAgent()
+
+class TokenBucket:
+    """Minimal async token-bucket rate limiter
+
+    Replaces the blind 1-3s sleep after every request: requests proceed
+    immediately while the per-host budget lasts and only wait when the
+    bucket is actually empty.
+    """
+
+    def __init__(self, max_rate: float = 3.0, time_period: float = 1.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = max_rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.max_rate,
+                    self._tokens + (now - self._updated) * self.max_rate / self.time_period)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep(
+                    (1 - self._tokens) * self.time_period / self.max_rate)
+
+# One limiter per remote host, shared by all scrapers
+_host_limiters: Dict[str, TokenBucket] = {}
+
+def get_rate_limiter(url: str) -> TokenBucket:
+    """Return the rate limiter for the host of the given URL"""
+    host = urlparse(url).netloc
+    limiter = _host_limiters.get(host)
+    if limiter is None:
+        limiter = _host_limiters[host] = TokenBucket()
+    return limiter
+
+# One HTTP connection pool shared by all scrapers. A session per scraper
+# meant sibling scrapers repeated TLS handshakes against the same hosts;
+# a single HTTP/2-capable client amortizes connections across the batch.
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it lazily"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=30.0,
+            follow_redirects=True
+        )
+    return _http_client
+
+# Conditional-request cache keyed by URL. Entries are only created for
+# responses that carry validators (ETag/Last-Modified): within the TTL
+# a repeat fetch is free, after it the server can answer 304 and we
+# reuse the stored body instead of re-downloading the page.
+_response_cache: Dict[str, Dict[str, Any]] = {}
+_RESPONSE_CACHE_TTL = 300.0
+
+# One Chromium process shared by all scrapers, handed out via refcount.
+# Launching a browser per scraper instance costs hundreds of MB RSS and
+# seconds of startup; a per-scraper BrowserContext gives the same
+# isolation for a fraction of that.
+_playwright = None
+_shared_browser: Optional[Browser] = None
+_browser_refcount = 0
+_browser_lock = asyncio.Lock()
+
+async def get_shared_browser() -> Browser:
+    """Acquire a reference to the shared Chromium instance, launching it on first use"""
+    global _playwright, _shared_browser, _browser_refcount
+    async with _browser_lock:
+        if _shared_browser is None:
+            _playwright = await async_playwright().start()
+            _shared_browser = await _playwright.chromium.launch(
+                headless=True,
+                args=[
+                    '--no-sandbox',
+                    '--disable-setuid-sandbox',
+                    '--disable-dev-shm-usage',
+                    '--disable-accelerated-2d-canvas',
+                    '--no-zygote'
+                ]
+            )
+        _browser_refcount += 1
+        return _shared_browser
+
+async def release_shared_browser():
+    """Release a reference; the browser shuts down when the last holder releases"""
+    global _playwright, _shared_browser, _browser_refcount
+    async with _browser_lock:
+        _browser_refcount -= 1
+        if _browser_refcount <= 0 and _shared_browser is not None:
+            await _shared_browser.close()
+            await _playwright.stop()
+            _shared_browser = None
+            _playwright = None
+            _browser_refcount = 0
+
+# lxml parses large result pages several times faster than the stdlib
+# parser; keep html.parser as a fallback for environments without it
+try:
+    BeautifulSoup('', 'lxml')
+    _SOUP_PARSER = 'lxml'
+except Exception:
+    _SOUP_PARSER = 'html.parser'
+
+def make_soup(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse HTML with the fastest parser available"""
+    return BeautifulSoup(html, _SOUP_PARSER, parse_only=parse_only)
+
+@functools.lru_cache(maxsize=256)
+def compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector, memoized for the process lifetime
+
+    Distinct selector strings are few (a handful per scraper), so every
+    selector is translated exactly once no matter how many pages or
+    listings pass through.
+    """
+    return soupsieve.compile(selector)
+
+@dataclass(slots=True)
 class VehicleData:
-    """Standardized vehicle data structure"""
-    def __init__(self):
-        self.make: Optional[str] = None
-        self.model: Optional[str] = None
-        self.trim: Optional[str] = None
-        self.year: Optional[int] = None
-        self.mileage: Optional[int] = None
-        self.asking_price: Optional[float] = None
-        self.location: Optional[str] = None
-        self.zip_code: Optional[str] = None
-        self.seller_type: Optional[SellerType] = None
-        self.source: Optional[Source] = None
-        self.url: Optional[str] = None
-        self.date_listed: Optional[datetime] = None
-        self.vin: Optional[str] = None
-        self.images: List[str] = []
-        self.description: Optional[str] = None
-        
+    """Standardized vehicle data structure
+
+    Slots instead of a per-instance __dict__: scrapes build thousands
+    of these, and the fixed layout roughly halves per-instance memory.
+    """
+
+    make: Optional[str] = None
+    model: Optional[str] = None
+    trim: Optional[str] = None
+    year: Optional[int] = None
+    mileage: Optional[int] = None
+    asking_price: Optional[float] = None
+    location: Optional[str] = None
+    zip_code: Optional[str] = None
+    seller_type: Optional[SellerType] = None
+    source: Optional[Source] = None
+    url: Optional[str] = None
+    date_listed: Optional[datetime] = None
+    vin: Optional[str] = None
+    images: List[str] = dataclass_field(default_factory=list)
+    description: Optional[str] = None
+
+    # Field layout for to_dict; mirrors the declaration order above
+    _FIELDS: ClassVar[tuple] = (
+        'make', 'model', 'trim', 'year', 'mileage', 'asking_price',
+        'location', 'zip_code', 'seller_type', 'source', 'url',
+        'date_listed', 'vin', 'images', 'description'
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for database storage"""
-        return {
-            "make": self.make,
-            "model": self.model,
-            "trim": self.trim,
-            "year": self.year,
-            "mileage": self.mileage,
-            "asking_price": self.asking_price,
-            "location": self.location,
-            "zip_code": self.zip_code,
-            "seller_type": self.seller_type.value if self.seller_type else None,
-            "source": self.source.value if self.source else None,
-            "url": self.url,
-            "date_listed": self.date_listed,
-            "vin": self.vin,
-            "images": self.images,
-            "description": self.description
-        }
+        result = {name: getattr(self, name) for name in self._FIELDS}
+        if self.seller_type:
+            result['seller_type'] = self.seller_type.value
+        if self.source:
+            result['source'] = self.source.value
+        return result
 
 class BaseScraper(ABC):
     """Base class for all vehicle scrapers"""
-    
+
+    # Whether the site renders its result pages with JavaScript.
+    # False lets fetch_listing_page skip the Playwright fallback when
+    # the static HTML comes back without listings (e.g. an empty search)
+    REQUIRES_JS = True
+
+    # Site-specific selector fallback table; subclasses override this
+    # at class level so the strings exist once per class instead of
+    # being rebuilt in every __init__
+    SELECTORS: Dict[str, tuple] = {}
+
+    # Common selectors that work across multiple sites
+    COMMON_SELECTORS = {
+        'price': (
+            '[data-test*="price"]',
+            '.price',
+            '[class*="price"]',
+            '[id*="price"]',
+            '.listing-price',
+            '.vehicle-price'
+        ),
+        'mileage': (
+            '[data-test*="mileage"]',
+            '.mileage',
+            '[class*="mileage"]',
+            '[class*="odometer"]',
+            '.vehicle-mileage'
+        ),
+        'location': (
+            '[data-test*="location"]',
+            '.location',
+            '[class*="location"]',
+            '.dealer-location',
+            '.seller-location'
+        ),
+        'year': (
+            '[data-test*="year"]',
+            '.year',
+            '[class*="year"]'
+        ),
+        'make_model': (
+            '[data-test*="vehicle-title"]',
+            '.vehicle-title',
+            '.listing-title',
+            'h1',
+            'h2'
+        )
+    }
+
     def __init__(self, source: Source):
         self.source = source
-        self.ua = UserAgent()
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.base_url = ""
+        # Draw one UA string per scraper lifetime - fake_useragent's
+        # random draw is not cheap enough for per-request use
+        self._ua_string = _SHARED_UA.random
         self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
-        self.request_delay = (1, 3)  # Random delay between requests
+        self.context = None
         self.max_retries = 3
         self.timeout = 30
-        
-        # Common selectors that work across multiple sites
-        self.common_selectors = {
-            'price': [
-                '[data-test*="price"]',
-                '.price',
-                '[class*="price"]',
-                '[id*="price"]',
-                '.listing-price',
-                '.vehicle-price'
-            ],
-            'mileage': [
-                '[data-test*="mileage"]',
-                '.mileage',
-                '[class*="mileage"]',
-                '[class*="odometer"]',
-                '.vehicle-mileage'
-            ],
-            'location': [
-                '[data-test*="location"]',
-                '.location',
-                '[class*="location"]',
-                '.dealer-location',
-                '.seller-location'
-            ],
-            'year': [
-                '[data-test*="year"]',
-                '.year',
-                '[class*="year"]'
-            ],
-            'make_model': [
-                '[data-test*="vehicle-title"]',
-                '.vehicle-title',
-                '.listing-title',
-                'h1',
-                'h2'
-            ]
+
+        self.common_selectors = self.COMMON_SELECTORS
+        self.selectors = self.SELECTORS
+        self.selectors_compiled: Dict[str, List[soupsieve.SoupSieve]] = {}
+        self.compile_selectors()
+
+        # Built search URLs keyed by their arguments; repeated runs of
+        # the same query skip the urlencode/string assembly
+        self._search_url_cache: Dict[tuple, str] = {}
+
+    def cached_search_url(self, query: str, location: str = "", *args) -> str:
+        """Memoized wrapper around get_search_url"""
+        key = (query, location) + args
+        url = self._search_url_cache.get(key)
+        if url is None:
+            url = self.get_search_url(query, location, *args)
+            self._search_url_cache[key] = url
+        return url
+
+    def compile_selectors(self):
+        """Precompile selector fallback lists once per scraper
+
+        Avoids re-translating the same CSS strings on every listing and
+        every field lookup (N_listings x N_fields x N_fallbacks otherwise).
+        """
+        self.selectors_compiled = {
+            field: [compile_selector(selector) for selector in selectors]
+            for field, selectors in self.selectors.items()
         }
-    
+        self._combined_selectors: Dict[tuple, soupsieve.SoupSieve] = {}
+        # Listing selector that matched on the last page; tried first on
+        # subsequent pages so the dead fallbacks are skipped
+        self._listing_selector_hit: Optional[str] = None
+
+    def find_listings(self, soup, limit: int = 0) -> List:
+        """Locate listing containers using the 'listings' fallback list
+
+        Site layouts do not change between pages of the same run, so the
+        selector that matched last time is tried first instead of
+        re-walking the tree for fallbacks that always miss.
+        """
+        selectors = self.selectors.get('listings', [])
+        ordered = selectors
+        hit = self._listing_selector_hit
+        if hit in selectors:
+            ordered = [hit] + [s for s in selectors if s != hit]
+
+        for selector in ordered:
+            listing_elements = compile_selector(selector).select(soup, limit=limit)
+            if listing_elements:
+                self._listing_selector_hit = selector
+                logger.info("Found %d listings with selector: %s",
+                            len(listing_elements), selector)
+                return listing_elements
+        return []
+
+    def extract_fields(self, listing_element, fields: tuple) -> Dict[str, Optional[str]]:
+        """Extract several fields from a listing subtree in one traversal
+
+        Walking the subtree once per field per fallback selector costs
+        N_fields x N_fallbacks passes per listing. Instead, run one
+        grouped select over all requested selectors and dispatch each
+        match back to its field with cheap match() tests. Fallback
+        priority within a field is preserved: a match for an earlier
+        selector replaces one from a later fallback.
+        """
+        combined = self._combined_selectors.get(fields)
+        if combined is None:
+            combined = compile_selector(', '.join(
+                selector for field in fields for selector in self.selectors[field]))
+            self._combined_selectors[fields] = combined
+
+        results: Dict[str, Optional[str]] = {field: None for field in fields}
+        # Best (lowest) fallback rank seen so far per field
+        best = {field: len(self.selectors_compiled[field]) for field in fields}
+        for element in combined.select(listing_element):
+            for field in fields:
+                if best[field] == 0:
+                    continue
+                for rank, selector in enumerate(self.selectors_compiled[field][:best[field]]):
+                    if selector.match(element):
+                        text = element.get_text(strip=True)
+                        if text:
+                            results[field] = text
+                            best[field] = rank
+                        break
+        return results
+
     async def __aenter__(self):
         """Async context manager entry"""
         await self.initialize()
@@ -124,69 +371,76 @@ class BaseScraper(ABC):
     
     async def initialize(self):
         """Initialize scraper resources"""
-        # Initialize HTTP session
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        connector = aiohttp.TCPConnector(limit=10, limit_per_host=5)
-        self.session = aiohttp.ClientSession(
-            timeout=timeout,
-            connector=connector,
-            headers={'User-Agent': self.ua.random}
+        # Use the shared Chromium instance; only the context (cookies,
+        # UA, viewport) is per-scraper
+        self.browser = await get_shared_browser()
+        self.context = await self.browser.new_context(
+            user_agent=self._ua_string,
+            # Desktop viewport to avoid mobile detection
+            viewport={"width": 1920, "height": 1080}
         )
-        
-        # Initialize Playwright browser for dynamic content
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=True,
-            args=[
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-accelerated-2d-canvas',
-                '--no-zygote',
-                '--single-process'
-            ]
-        )
-        
-        # Create page with random user agent
-        self.page = await self.browser.new_page()
-        await self.page.set_extra_http_headers({'User-Agent': self.ua.random})
-        
-        # Set viewport to avoid mobile detection
-        await self.page.set_viewport_size({"width": 1920, "height": 1080})
-        
+
         logger.info(f"Initialized {self.source.value} scraper")
-    
+
     async def cleanup(self):
         """Cleanup scraper resources"""
-        if self.session:
-            await self.session.close()
-        if self.browser:
-            await self.browser.close()
-        if hasattr(self, 'playwright'):
-            await self.playwright.stop()
+        if self.context:
+            await self.context.close()
+            self.context = None
+            await release_shared_browser()
+        self.browser = None
         logger.info(f"Cleaned up {self.source.value} scraper")
     
     async def get_with_retry(self, url: str, use_browser: bool = False) -> Optional[str]:
-        """Get webpage content with retry logic"""
+        """Get webpage content with retry logic, rate limited per host"""
+        cached = None if use_browser else _response_cache.get(url)
+        if cached and time.monotonic() - cached['fetched_at'] < _RESPONSE_CACHE_TTL:
+            return cached['html']
+
+        limiter = get_rate_limiter(url)
         for attempt in range(self.max_retries):
             try:
-                if use_browser and self.page:
-                    await self.page.goto(url, wait_until='domcontentloaded')
-                    # Random delay to avoid detection
-                    await asyncio.sleep(random.uniform(*self.request_delay))
-                    return await self.page.content()
+                await limiter.acquire()
+                if use_browser and self.context:
+                    # A fresh page per fetch: concurrent fetches (e.g.
+                    # gathered pagination) sharing one Page interleave
+                    # goto()/content() and return mismatched documents
+                    page = await self.context.new_page()
+                    try:
+                        await page.goto(url, wait_until='domcontentloaded')
+                        return await page.content()
+                    finally:
+                        await page.close()
                 else:
-                    async with self.session.get(url) as response:
-                        if response.status == 200:
-                            await asyncio.sleep(random.uniform(*self.request_delay))
-                            return await response.text()
-                        elif response.status == 429:
-                            # Rate limited, wait longer
-                            wait_time = 2 ** attempt
-                            logger.warning(f"Rate limited, waiting {wait_time}s")
-                            await asyncio.sleep(wait_time)
-                        else:
-                            logger.warning(f"HTTP {response.status} for {url}")
+                    headers = {'User-Agent': self._ua_string}
+                    if cached:
+                        if cached['etag']:
+                            headers['If-None-Match'] = cached['etag']
+                        if cached['last_modified']:
+                            headers['If-Modified-Since'] = cached['last_modified']
+                    client = get_http_client()
+                    response = await client.get(url, headers=headers)
+                    if response.status_code == 304 and cached:
+                        cached['fetched_at'] = time.monotonic()
+                        return cached['html']
+                    if response.status_code == 200:
+                        etag = response.headers.get('etag')
+                        last_modified = response.headers.get('last-modified')
+                        if etag or last_modified:
+                            _response_cache[url] = {
+                                'html': response.text,
+                                'etag': etag,
+                                'last_modified': last_modified,
+                                'fetched_at': time.monotonic()
+                            }
+                        return response.text
+                    elif response.status_code == 429:
+                        # Rate limited, wait longer
+                        wait_time = 2 ** attempt
+                        logger.warning(f"Rate limited, waiting {wait_time}s")
+                        await asyncio.sleep(wait_time)
+                    else:
+                        logger.warning(f"HTTP {response.status_code} for {url}")
                             
             except Exception as e:
                 logger.error(f"Attempt {attempt + 1} failed for {url}: {e}")
@@ -196,18 +450,49 @@ class BaseScraper(ABC):
         logger.error(f"Failed to fetch {url} after {self.max_retries} attempts")
         return None
     
-    def extract_with_fallback(self, soup: BeautifulSoup, selectors: List[str], 
+    def has_listings(self, html: str) -> bool:
+        """Check whether a page contains any of the listing containers"""
+        soup = BeautifulSoup(html, 'lxml')
+        for selector in self.selectors_compiled.get('listings', ()):
+            if selector.select_one(soup) is not None:
+                return True
+        return False
+
+    async def fetch_listing_page(self, url: str) -> Optional[str]:
+        """Fetch a search-result page, trying plain HTTP before the browser
+
+        A raw GET costs hundreds of ms; a full Playwright navigation
+        costs seconds. Try HTTP first and only fall back to the browser
+        when the static HTML carries none of the listing containers
+        (i.e. the page is JS-rendered). Scrapers that declare
+        REQUIRES_JS = False skip the browser fallback entirely.
+        """
+        html = await self.get_with_retry(url, use_browser=False)
+        if html and self.has_listings(html):
+            return html
+        if not self.REQUIRES_JS:
+            return html
+        return await self.get_with_retry(url, use_browser=True)
+
+    def extract_with_fallback(self, soup: BeautifulSoup, selectors: List,
                              text_only: bool = True) -> Optional[str]:
-        """Extract text using multiple fallback selectors"""
+        """Extract text using multiple fallback selectors
+
+        Accepts raw CSS strings or precompiled soupsieve selectors
+        (see compile_selectors); compiled selectors skip the per-call
+        CSS translation.
+        """
         for selector in selectors:
             try:
-                element = soup.select_one(selector)
+                if isinstance(selector, str):
+                    selector = compile_selector(selector)
+                element = selector.select_one(soup)
                 if element:
                     text = element.get_text(strip=True) if text_only else str(element)
                     if text:
                         return text
             except Exception as e:
-                logger.debug(f"Selector {selector} failed: {e}")
+                logger.debug("Selector %s failed: %s", selector, e)
                 continue
         return None
     
@@ -216,9 +501,9 @@ class BaseScraper(ABC):
         if not price_text:
             return None
         
-        # Remove common price prefixes/suffixes and keep only digits and decimal
-        cleaned = re.sub(r'[^\d.,]', '', price_text)
-        cleaned = cleaned.replace(',', '')
+        # Keep only digits and decimal point - one C-level pass instead
+        # of a regex sub plus a replace
+        cleaned = price_text.translate(_PRICE_TABLE)
         
         try:
             return float(cleaned)
@@ -231,7 +516,7 @@ class BaseScraper(ABC):
             return None
         
         # Extract numbers from mileage text
-        numbers = re.findall(r'\d+', mileage_text.replace(',', ''))
+        numbers = _DIGITS_RE.findall(mileage_text.replace(',', ''))
         if numbers:
             try:
                 return int(numbers[0])
@@ -243,33 +528,75 @@ class BaseScraper(ABC):
         """Extract year, make, and model from title text"""
         if not title_text:
             return None, None, None
-        
-        # Remove common prefixes
-        cleaned_title = title_text.replace("Used ", "").replace("New ", "").replace("Certified ", "").strip()
-        
-        # Common pattern: "2023 Ford F-150" or "2022 Porsche 911"
-        match = re.match(r'(\d{4})\s+([A-Za-z]+)\s+(.+)', cleaned_title)
+
+        # Common pattern: "2023 Ford F-150" or "Used 2022 Porsche 911";
+        # for models like "1500 TRX", keep multiple words
+        match = _YMM_RE.search(title_text)
         if match:
-            year = int(match.group(1))
-            make = match.group(2)
-            model_full = match.group(3)
-            # For models like "1500 TRX", keep multiple words
-            model = model_full.strip()
-            return year, make, model
-        
+            return (int(match.group('year')), match.group('make'),
+                    match.group('model').strip())
+
         return None, None, None
     
     def extract_zip_code(self, location_text: str) -> Optional[str]:
         """Extract zip code from location text"""
         if not location_text:
             return None
-        
+
         # Look for 5-digit zip codes
-        zip_match = re.search(r'\b\d{5}\b', location_text)
+        zip_match = _ZIP_RE.search(location_text)
         if zip_match:
             return zip_match.group()
         return None
-    
+
+    def find_listing_href(self, listing_element, fragment: str) -> Optional[str]:
+        """Find the first anchor href in a listing containing a fragment
+
+        A [href*=...] CSS selector makes soupsieve attribute-match every
+        element in the subtree; scanning just the anchors with a plain
+        substring test does the same job in a fraction of the work.
+        """
+        for anchor in listing_element.find_all('a', href=True):
+            if fragment in anchor['href']:
+                return anchor['href']
+        return None
+
+    def join_url(self, href: str) -> str:
+        """Resolve a listing href against the scraper's base_url
+
+        Hrefs on the supported sites are either absolute or
+        root-relative, so a prefix check plus concatenation covers the
+        hot path without urljoin's full parse; anything else still goes
+        through urljoin.
+        """
+        if href.startswith(('http://', 'https://')):
+            return href
+        if href.startswith('/'):
+            return self.base_url + href
+        return urljoin(self.base_url, href)
+
+    def apply_listing_fields(self, vehicle: VehicleData, title_text: Optional[str],
+                             price_text: Optional[str], mileage_text: Optional[str],
+                             location_text: Optional[str]) -> VehicleData:
+        """Run all per-listing text cleanups and populate the vehicle
+
+        Fuses the four cleanup helpers into one call so the per-listing
+        hot loop pays a single method dispatch instead of four.
+        """
+        if title_text:
+            year, make, model = self.extract_year_make_model(title_text)
+            vehicle.year = year
+            vehicle.make = make
+            vehicle.model = model
+        if price_text:
+            vehicle.asking_price = self.clean_price(price_text)
+        if mileage_text:
+            vehicle.mileage = self.clean_mileage(mileage_text)
+        if location_text:
+            vehicle.location = location_text
+            vehicle.zip_code = self.extract_zip_code(location_text)
+        return vehicle
+
     @abstractmethod
     async def scrape_search_results(self, query: str, location: str = "", 
                                    max_results: int = 50) -> List[VehicleData]:
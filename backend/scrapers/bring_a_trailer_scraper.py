@@ -4,51 +4,55 @@ Scrapes auction data from BringATrailer.com - premium enthusiast auction platfor
 """
 
 import logging
-import re
 from typing import List, Optional
-from urllib.parse import urlencode, urljoin
-from bs4 import BeautifulSoup
+from urllib.parse import urlencode
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime
 
-from .base_scraper import BaseScraper, VehicleData
+from .base_scraper import BaseScraper, VehicleData, compile_selector
 from ..models import Source, SellerType
 
 logger = logging.getLogger(__name__)
 
 class BringATrailerScraper(BaseScraper):
     """BringATrailer.com auction scraper"""
+
+    # BaT-specific selectors
+    SELECTORS = {
+        'listings': (
+            '.auction-item',
+            '.auctions-item',
+            '.listing-item'
+        ),
+        'title': (
+            '.auction-title',
+            '.listing-title',
+            'h3 a'
+        ),
+        'price': (
+            '.current-bid',
+            '.bid-amount',
+            '.price-current'
+        ),
+        'end_time': (
+            '.auction-end',
+            '.time-left',
+            '.listing-end'
+        ),
+        'status': (
+            '.auction-status',
+            '.bid-status'
+        )
+    }
     
     def __init__(self):
         super().__init__(Source.BRING_A_TRAILER)
         self.base_url = "https://bringatrailer.com"
         
-        # BaT-specific selectors
-        self.selectors = {
-            'listings': [
-                '.auction-item',
-                '.auctions-item',
-                '.listing-item'
-            ],
-            'title': [
-                '.auction-title',
-                '.listing-title',
-                'h3 a'
-            ],
-            'price': [
-                '.current-bid',
-                '.bid-amount',
-                '.price-current'
-            ],
-            'end_time': [
-                '.auction-end',
-                '.time-left',
-                '.listing-end'
-            ],
-            'status': [
-                '.auction-status',
-                '.bid-status'
-            ]
-        }
+        # Only parse auction cards - skips nav/footer subtrees entirely
+        self.listing_strainer = SoupStrainer(class_='auction-item')
+
+        self._auction_link_sel = compile_selector('a[href*="/auction/"]')
     
     def get_search_url(self, query: str, location: str = "") -> str:
         """Generate BaT search URL"""
@@ -65,16 +69,18 @@ class BringATrailerScraper(BaseScraper):
         vehicles = []
         
         try:
-            search_url = self.get_search_url(query, location)
+            search_url = self.cached_search_url(query, location)
             logger.info(f"Scraping Bring a Trailer: {search_url}")
             
-            html = await self.get_with_retry(search_url, use_browser=True)
+            html = await self.fetch_listing_page(search_url)
             if not html:
                 logger.error("Failed to get BaT HTML")
                 return vehicles
             
-            soup = BeautifulSoup(html, 'html.parser')
-            
+            # Restrict parsing to auction cards; fall back to a full parse
+            # if the strained tree comes up empty (page layout changed)
+            soup = BeautifulSoup(html, 'lxml', parse_only=self.listing_strainer)
+
             # Find listing containers
             listing_elements = []
             for selector in self.selectors['listings']:
@@ -82,6 +88,14 @@ class BringATrailerScraper(BaseScraper):
                 if listing_elements:
                     logger.info(f"Found {len(listing_elements)} listings with selector: {selector}")
                     break
+
+            if not listing_elements:
+                soup = BeautifulSoup(html, 'lxml')
+                for selector in self.selectors['listings']:
+                    listing_elements = soup.select(selector)
+                    if listing_elements:
+                        logger.info(f"Found {len(listing_elements)} listings with selector: {selector}")
+                        break
             
             if not listing_elements:
                 logger.warning("No listings found on Bring a Trailer")
@@ -90,10 +104,10 @@ class BringATrailerScraper(BaseScraper):
             # Process each listing
             for i, listing in enumerate(listing_elements[:max_results]):
                 try:
-                    vehicle = await self._parse_listing(listing)
+                    vehicle = self._parse_listing(listing)
                     if vehicle and vehicle.asking_price:
                         vehicles.append(vehicle)
-                        logger.debug(f"Parsed vehicle {i+1}: {vehicle.year} {vehicle.make} {vehicle.model}")
+                        logger.debug("Parsed vehicle %d: %s %s %s", i + 1, vehicle.year, vehicle.make, vehicle.model)
                 except Exception as e:
                     logger.error(f"Error parsing listing {i+1}: {e}")
                     continue
@@ -105,7 +119,7 @@ class BringATrailerScraper(BaseScraper):
         
         return vehicles
     
-    async def _parse_listing(self, listing_element) -> Optional[VehicleData]:
+    def _parse_listing(self, listing_element) -> Optional[VehicleData]:
         """Parse individual auction listing"""
         vehicle = VehicleData()
         vehicle.source = Source.BRING_A_TRAILER
@@ -113,7 +127,7 @@ class BringATrailerScraper(BaseScraper):
         
         try:
             # Extract title/vehicle info
-            title_text = self.extract_with_fallback(listing_element, self.selectors['title'])
+            title_text = self.extract_with_fallback(listing_element, self.selectors_compiled['title'])
             if title_text:
                 year, make, model = self.extract_year_make_model(title_text)
                 vehicle.year = year
@@ -121,16 +135,16 @@ class BringATrailerScraper(BaseScraper):
                 vehicle.model = model
             
             # Extract current bid/final price
-            price_text = self.extract_with_fallback(listing_element, self.selectors['price'])
+            price_text = self.extract_with_fallback(listing_element, self.selectors_compiled['price'])
             vehicle.asking_price = self.clean_price(price_text)
             
             # BaT is nationwide
             vehicle.location = "Auction Platform"
             
             # Extract listing URL
-            url_element = listing_element.select_one('a[href*="/auction/"]')
+            url_element = self._auction_link_sel.select_one(listing_element)
             if url_element and url_element.get('href'):
-                vehicle.url = urljoin(self.base_url, url_element['href'])
+                vehicle.url = self.join_url(url_element['href'])
             
             return vehicle
             
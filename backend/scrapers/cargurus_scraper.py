@@ -3,54 +3,53 @@ CarGurus Scraper for FlipBot AI
 Scrapes vehicle listings from CarGurus.com
 """
 
+import asyncio
 import logging
-import re
 from typing import List, Optional
-from urllib.parse import urlencode, urljoin
-from bs4 import BeautifulSoup
+from urllib.parse import urlencode
 
-from .base_scraper import BaseScraper, VehicleData
+from .base_scraper import BaseScraper, VehicleData, make_soup
 from ..models import Source, SellerType
 
 logger = logging.getLogger(__name__)
 
 class CarGurusScraper(BaseScraper):
     """CarGurus.com vehicle scraper"""
+
+    # CarGurus-specific selectors
+    SELECTORS = {
+        'listings': (
+            '[data-cg-ft="srp-listing-row"]',
+            '.srp-listing',
+            '.listing-row',
+            '.cargurus-listing'
+        ),
+        'title': (
+            '[data-cg-ft="srp-listing-title"]',
+            '.listing-title',
+            'h4',
+            '.vehicle-title'
+        ),
+        'price': (
+            '[data-cg-ft="srp-listing-price"]',
+            '.listing-price',
+            '.price-section'
+        ),
+        'mileage': (
+            '[data-cg-ft="srp-listing-mileage"]',
+            '.listing-mileage',
+            '.mileage'
+        ),
+        'location': (
+            '.listing-dealer',
+            '.dealer-distance',
+            '.location-text'
+        )
+    }
     
     def __init__(self):
         super().__init__(Source.CARGURUS)
         self.base_url = "https://www.cargurus.com"
-        
-        # CarGurus-specific selectors
-        self.selectors = {
-            'listings': [
-                '[data-cg-ft="srp-listing-row"]',
-                '.srp-listing',
-                '.listing-row',
-                '.cargurus-listing'
-            ],
-            'title': [
-                '[data-cg-ft="srp-listing-title"]',
-                '.listing-title',
-                'h4',
-                '.vehicle-title'
-            ],
-            'price': [
-                '[data-cg-ft="srp-listing-price"]',
-                '.listing-price',
-                '.price-section'
-            ],
-            'mileage': [
-                '[data-cg-ft="srp-listing-mileage"]',
-                '.listing-mileage',
-                '.mileage'
-            ],
-            'location': [
-                '.listing-dealer',
-                '.dealer-distance',
-                '.location-text'
-            ]
-        }
     
     def get_search_url(self, query: str, location: str = "") -> str:
         """Generate CarGurus search URL"""
@@ -79,38 +78,19 @@ class CarGurusScraper(BaseScraper):
         vehicles = []
         
         try:
-            search_url = self.get_search_url(query, location)
+            search_url = self.cached_search_url(query, location)
             logger.info(f"Scraping CarGurus: {search_url}")
             
-            html = await self.get_with_retry(search_url, use_browser=True)
+            html = await self.fetch_listing_page(search_url)
             if not html:
                 logger.error("Failed to get CarGurus HTML")
                 return vehicles
             
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Find listing containers
-            listing_elements = []
-            for selector in self.selectors['listings']:
-                listing_elements = soup.select(selector)
-                if listing_elements:
-                    logger.info(f"Found {len(listing_elements)} listings with selector: {selector}")
-                    break
-            
-            if not listing_elements:
-                logger.warning("No listings found on CarGurus")
-                return vehicles
-            
-            # Process each listing
-            for i, listing in enumerate(listing_elements[:max_results]):
-                try:
-                    vehicle = await self._parse_listing(listing)
-                    if vehicle and vehicle.asking_price:
-                        vehicles.append(vehicle)
-                        logger.debug(f"Parsed vehicle {i+1}: {vehicle.year} {vehicle.make} {vehicle.model}")
-                except Exception as e:
-                    logger.error(f"Error parsing listing {i+1}: {e}")
-                    continue
+            # Parsing a result page is CPU-bound bs4 work; run it on a
+            # worker thread so the event loop stays free for the other
+            # scrapers' network I/O
+            vehicles = await asyncio.to_thread(
+                self._extract_listings, html, max_results)
             
             logger.info(f"Successfully scraped {len(vehicles)} vehicles from CarGurus")
             
@@ -119,38 +99,55 @@ class CarGurusScraper(BaseScraper):
         
         return vehicles
     
-    async def _parse_listing(self, listing_element) -> Optional[VehicleData]:
+    def _extract_listings(self, html: str, max_results: int) -> List[VehicleData]:
+        """Parse a result page into vehicles (synchronous, runs off-loop)"""
+        vehicles = []
+        soup = make_soup(html)
+
+        # Find listing containers
+        listing_elements = self.find_listings(soup, limit=max_results)
+        if not listing_elements:
+            logger.warning("No listings found on CarGurus")
+            return vehicles
+
+        # Process each listing
+        for i, listing in enumerate(listing_elements):
+            try:
+                vehicle = self._parse_listing(listing)
+                if vehicle and vehicle.asking_price:
+                    vehicles.append(vehicle)
+                    logger.debug("Parsed vehicle %d: %s %s %s", i + 1, vehicle.year, vehicle.make, vehicle.model)
+            except Exception as e:
+                logger.error(f"Error parsing listing {i+1}: {e}")
+                continue
+
+        return vehicles
+
+    def _parse_listing(self, listing_element) -> Optional[VehicleData]:
         """Parse individual vehicle listing"""
         vehicle = VehicleData()
         vehicle.source = Source.CARGURUS
         
         try:
-            # Extract title/vehicle info
-            title_text = self.extract_with_fallback(listing_element, self.selectors['title'])
-            if title_text:
-                year, make, model = self.extract_year_make_model(title_text)
-                vehicle.year = year
-                vehicle.make = make
-                vehicle.model = model
-            
-            # Extract price
-            price_text = self.extract_with_fallback(listing_element, self.selectors['price'])
-            vehicle.asking_price = self.clean_price(price_text)
-            
-            # Extract mileage
-            mileage_text = self.extract_with_fallback(listing_element, self.selectors['mileage'])
-            vehicle.mileage = self.clean_mileage(mileage_text)
-            
-            # Extract location
-            location_text = self.extract_with_fallback(listing_element, self.selectors['location'])
-            if location_text:
-                vehicle.location = location_text
-                vehicle.zip_code = self.extract_zip_code(location_text)
+            # Extract all fields in a single pass over the listing subtree
+            fields = self.extract_fields(
+                listing_element, ('title', 'price', 'mileage', 'location'))
+
+            # Callers drop listings without a price; bail out before the
+            # title parsing and link scan when there is none
+            asking_price = self.clean_price(fields['price'])
+            if not asking_price:
+                return None
+            vehicle.asking_price = asking_price
+
+            self.apply_listing_fields(
+                vehicle, fields['title'], None,
+                fields['mileage'], fields['location'])
             
             # Extract listing URL
-            url_element = listing_element.select_one('a[href*="/VehicleDetails/"]')
-            if url_element and url_element.get('href'):
-                vehicle.url = urljoin(self.base_url, url_element['href'])
+            href = self.find_listing_href(listing_element, '/VehicleDetails/')
+            if href:
+                vehicle.url = self.join_url(href)
             
             # Default to dealer for CarGurus
             vehicle.seller_type = SellerType.DEALER
@@ -3,19 +3,47 @@ Craigslist Scraper for FlipBot AI
 Scrapes vehicle listings from Craigslist
 """
 
+import asyncio
 import logging
-import re
 from typing import List, Optional
-from urllib.parse import urlencode, urljoin, urlparse
-from bs4 import BeautifulSoup
+from urllib.parse import urlencode
 
-from .base_scraper import BaseScraper, VehicleData
+from .base_scraper import BaseScraper, VehicleData, make_soup
 from ..models import Source, SellerType
 
 logger = logging.getLogger(__name__)
 
 class CraigslistScraper(BaseScraper):
     """Craigslist vehicle scraper"""
+
+    # Craigslist is plain server-rendered HTML
+    REQUIRES_JS = False
+
+    # Craigslist-specific selectors
+    SELECTORS = {
+        'listings': (
+            '.cl-static-search-result',
+            '.result-row',
+            'li.result-row'
+        ),
+        'title': (
+            '.titlestring',
+            '.result-title',
+            'a.titlestring'
+        ),
+        'price': (
+            '.result-price',
+            '.price'
+        ),
+        'location': (
+            '.result-hood',
+            '.hood'
+        ),
+        'date': (
+            '.result-date',
+            'time'
+        )
+    }
     
     def __init__(self):
         super().__init__(Source.CRAIGSLIST)
@@ -27,32 +55,6 @@ class CraigslistScraper(BaseScraper):
             'philadelphia', 'sanantonio', 'sandiego', 'dallas', 'seattle',
             'denver', 'boston', 'atlanta', 'miami', 'detroit'
         ]
-        
-        # Craigslist-specific selectors
-        self.selectors = {
-            'listings': [
-                '.cl-static-search-result',
-                '.result-row',
-                'li.result-row'
-            ],
-            'title': [
-                '.titlestring',
-                '.result-title',
-                'a.titlestring'
-            ],
-            'price': [
-                '.result-price',
-                '.price'
-            ],
-            'location': [
-                '.result-hood',
-                '.hood'
-            ],
-            'date': [
-                '.result-date',
-                'time'
-            ]
-        }
     
     def get_search_url(self, query: str, location: str = "", metro_area: str = "newyork") -> str:
         """Generate Craigslist search URL"""
@@ -67,79 +69,112 @@ class CraigslistScraper(BaseScraper):
         
         return f"https://{metro_area}.craigslist.org/search/cta?" + urlencode(params)
     
-    async def scrape_search_results(self, query: str, location: str = "", 
+    async def scrape_search_results(self, query: str, location: str = "",
                                    max_results: int = 50) -> List[VehicleData]:
         """Scrape Craigslist search results across multiple metro areas"""
         vehicles = []
-        
-        # Search across multiple metro areas for better coverage
-        for metro in self.metro_areas[:3]:  # Limit to 3 metros to avoid overwhelming
-            try:
-                search_url = self.get_search_url(query, location, metro)
-                logger.info(f"Scraping Craigslist {metro}: {search_url}")
-                
-                html = await self.get_with_retry(search_url, use_browser=False)
-                if not html:
-                    logger.error(f"Failed to get Craigslist HTML for {metro}")
-                    continue
-                
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Find listing containers
-                listing_elements = []
-                for selector in self.selectors['listings']:
-                    listing_elements = soup.select(selector)
-                    if listing_elements:
-                        logger.info(f"Found {len(listing_elements)} listings in {metro} with selector: {selector}")
-                        break
-                
-                if not listing_elements:
-                    logger.warning(f"No listings found on Craigslist {metro}")
-                    continue
-                
-                # Process each listing
-                metro_vehicles = []
-                for i, listing in enumerate(listing_elements[:max_results//3]):  # Distribute across metros
-                    try:
-                        vehicle = await self._parse_listing(listing, metro)
-                        if vehicle and vehicle.asking_price:
-                            metro_vehicles.append(vehicle)
-                            logger.debug(f"Parsed vehicle {i+1}: {vehicle.year} {vehicle.make} {vehicle.model}")
-                    except Exception as e:
-                        logger.error(f"Error parsing listing {i+1} in {metro}: {e}")
-                        continue
-                
-                vehicles.extend(metro_vehicles)
-                logger.info(f"Successfully scraped {len(metro_vehicles)} vehicles from Craigslist {metro}")
-                
-            except Exception as e:
-                logger.error(f"Craigslist {metro} scraping failed: {e}")
+
+        # Metros are independent sites; scraping them concurrently makes
+        # total wall time the slowest metro instead of the sum of all three
+        metros = self.metro_areas[:3]  # Limit to 3 metros to avoid overwhelming
+        results = await asyncio.gather(
+            *(self._scrape_metro(query, location, metro, max_results // len(metros))
+              for metro in metros),
+            return_exceptions=True
+        )
+
+        # searchNearby makes neighbouring metros return overlapping
+        # listings; drop duplicates before they hit downstream scoring
+        seen = set()
+        for metro, result in zip(metros, results):
+            if isinstance(result, Exception):
+                logger.error(f"Craigslist {metro} scraping failed: {result}")
                 continue
-        
+            for vehicle in result:
+                if vehicle.url:
+                    key = vehicle.url.split('?', 1)[0]
+                else:
+                    key = (vehicle.year, vehicle.make, vehicle.model,
+                           vehicle.asking_price)
+                if key in seen:
+                    continue
+                seen.add(key)
+                vehicles.append(vehicle)
+
         logger.info(f"Total Craigslist vehicles scraped: {len(vehicles)}")
         return vehicles
-    
-    async def _parse_listing(self, listing_element, metro_area: str) -> Optional[VehicleData]:
+
+    async def _scrape_metro(self, query: str, location: str, metro: str,
+                            max_results: int) -> List[VehicleData]:
+        """Scrape a single metro area's search results"""
+        search_url = self.cached_search_url(query, location, metro)
+        logger.info(f"Scraping Craigslist {metro}: {search_url}")
+
+        html = await self.get_with_retry(search_url, use_browser=False)
+        if not html:
+            logger.error(f"Failed to get Craigslist HTML for {metro}")
+            return []
+
+        # Parsing a result page is CPU-bound bs4 work; run it on a
+        # worker thread so the event loop stays free for the other
+        # metros' network I/O
+        metro_vehicles = await asyncio.to_thread(
+            self._extract_listings, html, max_results, metro)
+
+        logger.info(f"Successfully scraped {len(metro_vehicles)} vehicles from Craigslist {metro}")
+        return metro_vehicles
+
+    def _extract_listings(self, html: str, max_results: int,
+                          metro: str) -> List[VehicleData]:
+        """Parse a metro's result page into vehicles (synchronous, runs off-loop)"""
+        metro_vehicles = []
+        soup = make_soup(html)
+
+        # Find listing containers
+        listing_elements = self.find_listings(soup, limit=max_results)
+        if not listing_elements:
+            logger.warning(f"No listings found on Craigslist {metro}")
+            return metro_vehicles
+
+        # Process each listing
+        for i, listing in enumerate(listing_elements):
+            try:
+                vehicle = self._parse_listing(listing, metro)
+                if vehicle and vehicle.asking_price:
+                    metro_vehicles.append(vehicle)
+                    logger.debug("Parsed vehicle %d: %s %s %s", i + 1, vehicle.year, vehicle.make, vehicle.model)
+            except Exception as e:
+                logger.error(f"Error parsing listing {i+1} in {metro}: {e}")
+                continue
+
+        return metro_vehicles
+
+    def _parse_listing(self, listing_element, metro_area: str) -> Optional[VehicleData]:
         """Parse individual vehicle listing"""
         vehicle = VehicleData()
         vehicle.source = Source.CRAIGSLIST
         vehicle.seller_type = SellerType.PRIVATE  # Craigslist is mostly private sellers
         
         try:
-            # Extract title/vehicle info
-            title_text = self.extract_with_fallback(listing_element, self.selectors['title'])
+            # Extract all fields in a single pass over the listing subtree
+            fields = self.extract_fields(
+                listing_element, ('title', 'price', 'location'))
+
+            # Callers drop listings without a price; bail out before the
+            # title parsing and link scan when there is none
+            asking_price = self.clean_price(fields['price'])
+            if not asking_price:
+                return None
+            vehicle.asking_price = asking_price
+
+            title_text = fields['title']
             if title_text:
                 year, make, model = self.extract_year_make_model(title_text)
                 vehicle.year = year
                 vehicle.make = make
                 vehicle.model = model
-            
-            # Extract price
-            price_text = self.extract_with_fallback(listing_element, self.selectors['price'])
-            vehicle.asking_price = self.clean_price(price_text)
-            
-            # Extract location
-            location_text = self.extract_with_fallback(listing_element, self.selectors['location'])
+
+            location_text = fields['location']
             if location_text:
                 vehicle.location = f"{location_text}, {metro_area}"
                 vehicle.zip_code = self.extract_zip_code(location_text)
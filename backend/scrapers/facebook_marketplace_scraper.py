@@ -3,48 +3,54 @@ Facebook Marketplace Scraper for FlipBot AI
 Scrapes vehicle listings from Facebook Marketplace - essential for private party deals
 """
 
+import asyncio
 import logging
-import re
 from typing import List, Optional
-from urllib.parse import urlencode, urljoin
-from bs4 import BeautifulSoup
+from urllib.parse import urlencode
 
-from .base_scraper import BaseScraper, VehicleData
+from .base_scraper import BaseScraper, VehicleData, make_soup
 from ..models import Source, SellerType
 
 logger = logging.getLogger(__name__)
 
 class FacebookMarketplaceScraper(BaseScraper):
     """Facebook Marketplace vehicle scraper"""
-    
+
+    # Facebook Marketplace-specific selectors
+    SELECTORS = {
+        'listings': (
+            '[data-testid="marketplace-item"]',
+            '.x9f619',
+            '.marketplace-item',
+            '[role="article"]'
+        ),
+        'title': (
+            '[data-testid="marketplace-item-title"]',
+            '.x1lliihq',
+            '.marketplace-item-title'
+        ),
+        'price': (
+            '[data-testid="marketplace-item-price"]',
+            '.marketplace-item-price',
+            '.x193iq5w'
+        ),
+        'location': (
+            '[data-testid="marketplace-item-location"]',
+            '.marketplace-item-location',
+            '.x1i10hfl'
+        )
+    }
+
+    # data-testid values the parser consumes, mapped to field names
+    TESTID_FIELDS = {
+        'marketplace-item-title': 'title',
+        'marketplace-item-price': 'price',
+        'marketplace-item-location': 'location'
+    }
+
     def __init__(self):
         super().__init__(Source.FACEBOOK)
         self.base_url = "https://www.facebook.com"
-        
-        # Facebook Marketplace-specific selectors
-        self.selectors = {
-            'listings': [
-                '[data-testid="marketplace-item"]',
-                '.x9f619',
-                '.marketplace-item',
-                '[role="article"]'
-            ],
-            'title': [
-                '[data-testid="marketplace-item-title"]',
-                '.x1lliihq',
-                '.marketplace-item-title'
-            ],
-            'price': [
-                '[data-testid="marketplace-item-price"]',
-                '.marketplace-item-price',
-                '.x193iq5w'
-            ],
-            'location': [
-                '[data-testid="marketplace-item-location"]',
-                '.marketplace-item-location',
-                '.x1i10hfl'
-            ]
-        }
     
     def get_search_url(self, query: str, location: str = "") -> str:
         """Generate Facebook Marketplace search URL"""
@@ -65,7 +71,7 @@ class FacebookMarketplaceScraper(BaseScraper):
         vehicles = []
         
         try:
-            search_url = self.get_search_url(query, location)
+            search_url = self.cached_search_url(query, location)
             logger.info(f"Scraping Facebook Marketplace: {search_url}")
             
             # Facebook requires browser automation due to heavy JS
@@ -74,30 +80,11 @@ class FacebookMarketplaceScraper(BaseScraper):
                 logger.error("Failed to get Facebook Marketplace HTML")
                 return vehicles
             
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Find listing containers
-            listing_elements = []
-            for selector in self.selectors['listings']:
-                listing_elements = soup.select(selector)
-                if listing_elements:
-                    logger.info(f"Found {len(listing_elements)} listings with selector: {selector}")
-                    break
-            
-            if not listing_elements:
-                logger.warning("No listings found on Facebook Marketplace")
-                return vehicles
-            
-            # Process each listing
-            for i, listing in enumerate(listing_elements[:max_results]):
-                try:
-                    vehicle = await self._parse_listing(listing)
-                    if vehicle and vehicle.asking_price:
-                        vehicles.append(vehicle)
-                        logger.debug(f"Parsed vehicle {i+1}: {vehicle.year} {vehicle.make} {vehicle.model}")
-                except Exception as e:
-                    logger.error(f"Error parsing listing {i+1}: {e}")
-                    continue
+            # Parsing a result page is CPU-bound bs4 work; run it on a
+            # worker thread so the event loop stays free for the other
+            # scrapers' network I/O
+            vehicles = await asyncio.to_thread(
+                self._extract_listings, html, max_results)
             
             logger.info(f"Successfully scraped {len(vehicles)} vehicles from Facebook Marketplace")
             
@@ -106,35 +93,72 @@ class FacebookMarketplaceScraper(BaseScraper):
         
         return vehicles
     
-    async def _parse_listing(self, listing_element) -> Optional[VehicleData]:
+    def _extract_listings(self, html: str, max_results: int) -> List[VehicleData]:
+        """Parse a result page into vehicles (synchronous, runs off-loop)"""
+        vehicles = []
+        soup = make_soup(html)
+
+        # Find listing containers
+        listing_elements = self.find_listings(soup, limit=max_results)
+        if not listing_elements:
+            logger.warning("No listings found on Facebook Marketplace")
+            return vehicles
+
+        # Process each listing
+        for i, listing in enumerate(listing_elements):
+            try:
+                vehicle = self._parse_listing(listing)
+                if vehicle and vehicle.asking_price:
+                    vehicles.append(vehicle)
+                    logger.debug("Parsed vehicle %d: %s %s %s", i + 1, vehicle.year, vehicle.make, vehicle.model)
+            except Exception as e:
+                logger.error(f"Error parsing listing {i+1}: {e}")
+                continue
+
+        return vehicles
+
+    def _parse_listing(self, listing_element) -> Optional[VehicleData]:
         """Parse individual vehicle listing"""
         vehicle = VehicleData()
         vehicle.source = Source.FACEBOOK
         vehicle.seller_type = SellerType.PRIVATE  # Facebook Marketplace is mostly private sellers
         
         try:
-            # Extract title/vehicle info
-            title_text = self.extract_with_fallback(listing_element, self.selectors['title'])
-            if title_text:
-                year, make, model = self.extract_year_make_model(title_text)
-                vehicle.year = year
-                vehicle.make = make
-                vehicle.model = model
-            
-            # Extract price
-            price_text = self.extract_with_fallback(listing_element, self.selectors['price'])
-            vehicle.asking_price = self.clean_price(price_text)
-            
-            # Extract location
-            location_text = self.extract_with_fallback(listing_element, self.selectors['location'])
-            if location_text:
-                vehicle.location = location_text
-                vehicle.zip_code = self.extract_zip_code(location_text)
+            # Facebook tags its fields with data-testid; one find_all
+            # over the subtree indexes them directly without any CSS
+            # matching. The selector table only runs as a fallback for
+            # markup variants without test ids.
+            fields = {}
+            for element in listing_element.find_all(attrs={'data-testid': True}):
+                field = self.TESTID_FIELDS.get(element['data-testid'])
+                if field and field not in fields:
+                    fields[field] = element.get_text(strip=True)
+
+            if not fields:
+                fields = self.extract_fields(
+                    listing_element, ('title', 'price', 'location'))
+            else:
+                fields = {field: fields.get(field)
+                          for field in ('title', 'price', 'location')}
+
+            # Callers drop listings without a price; a cheap digit scan
+            # rejects "Free"/placeholder strings before clean_price runs
+            price_text = fields['price']
+            if not price_text or not any(c.isdigit() for c in price_text):
+                return None
+            asking_price = self.clean_price(price_text)
+            if not asking_price:
+                return None
+            vehicle.asking_price = asking_price
+
+            self.apply_listing_fields(
+                vehicle, fields['title'], None,
+                None, fields['location'])
             
             # Extract listing URL
-            url_element = listing_element.select_one('a[href*="/marketplace/item/"]')
-            if url_element and url_element.get('href'):
-                vehicle.url = urljoin(self.base_url, url_element['href'])
+            href = self.find_listing_href(listing_element, '/marketplace/item/')
+            if href:
+                vehicle.url = self.join_url(href)
             
             return vehicle
             
@@ -5,10 +5,13 @@ Coordinates all vehicle scrapers and manages scraping operations
 
 import asyncio
 import logging
+import time
 from typing import List, Dict, Optional, Set
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import Counter
+
+from pymongo import UpdateOne
 
 from .base_scraper import VehicleData
 from .autotrader_scraper import AutoTraderScraper
@@ -19,11 +22,36 @@ from .carmax_scraper import CarMaxScraper
 from .carvana_scraper import CarvanaScraper
 from .facebook_marketplace_scraper import FacebookMarketplaceScraper
 from .bring_a_trailer_scraper import BringATrailerScraper
-from ..models import Source, Vehicle, calculate_market_metrics
+from ..models import (
+    Source, Vehicle, add_normalized_fields, calculate_market_metrics_batch
+)
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# URLs upserted earlier in this process, shared across jobs so a repeat
+# scrape inside the same session skips the write for listings that are
+# already in the database. Cleared when it grows past the cap (a plain
+# set is simpler than a bloom filter and exact at this scale).
+_stored_listing_urls: Set[str] = set()
+_STORED_URLS_MAX = 100_000
+
+# Default to most reliable sources
+_DEFAULT_SOURCES = (
+    Source.CARS_COM, Source.AUTOTRADER, Source.CARGURUS,
+    Source.CARMAX, Source.CARVANA, Source.CRAIGSLIST, Source.FACEBOOK
+)
+
+_CATEGORY_MAP = {
+    "retail": (Source.CARS_COM, Source.AUTOTRADER, Source.CARGURUS, Source.CARMAX, Source.CARVANA, Source.VROOM, Source.SHIFT),
+    "marketplace": (Source.FACEBOOK, Source.CRAIGSLIST),
+    "auction": (Source.BRING_A_TRAILER, Source.CARS_AND_BIDS, Source.EBAY_MOTORS),
+    "analytics": (Source.ISEECARS, Source.CAREDGE, Source.TRUECAR),
+    "enthusiast": (Source.BRING_A_TRAILER, Source.CARS_AND_BIDS, Source.HEMMINGS),
+    "dealer_network": (Source.AUTONATION,),
+    "valuation": (Source.KBB, Source.EDMUNDS, Source.PEDDLE)
+}
+
+@dataclass(slots=True)
 class ScrapingJob:
     """Represents a scraping job"""
     query: str
@@ -37,34 +65,20 @@ class ScrapingJob:
         if self.created_at is None:
             self.created_at = datetime.utcnow()
         if self.sources is None and self.source_categories is None:
-            # Default to most reliable sources
-            self.sources = [
-                Source.CARS_COM, Source.AUTOTRADER, Source.CARGURUS,
-                Source.CARMAX, Source.CARVANA, Source.CRAIGSLIST, Source.FACEBOOK
-            ]
+            self.sources = list(_DEFAULT_SOURCES)
         elif self.source_categories and not self.sources:
             self.sources = self._get_sources_by_categories()
     
     def _get_sources_by_categories(self) -> List[Source]:
         """Get sources based on categories"""
-        category_map = {
-            "retail": [Source.CARS_COM, Source.AUTOTRADER, Source.CARGURUS, Source.CARMAX, Source.CARVANA, Source.VROOM, Source.SHIFT],
-            "marketplace": [Source.FACEBOOK, Source.CRAIGSLIST],
-            "auction": [Source.BRING_A_TRAILER, Source.CARS_AND_BIDS, Source.EBAY_MOTORS],
-            "analytics": [Source.ISEECARS, Source.CAREDGE, Source.TRUECAR],
-            "enthusiast": [Source.BRING_A_TRAILER, Source.CARS_AND_BIDS, Source.HEMMINGS],
-            "dealer_network": [Source.AUTONATION],
-            "valuation": [Source.KBB, Source.EDMUNDS, Source.PEDDLE]
-        }
-        
         sources = []
         for category in self.source_categories:
-            if category in category_map:
-                sources.extend(category_map[category])
-        
+            if category in _CATEGORY_MAP:
+                sources.extend(_CATEGORY_MAP[category])
+
         return list(set(sources))  # Remove duplicates
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingResult:
     """Results of a scraping operation"""
     job: ScrapingJob
@@ -80,12 +94,33 @@ class ScrapingManager:
     def __init__(self, db):
         self.db = db
         self.scrapers = {}
-        self.active_jobs: Set[str] = set()
+        self.active_jobs: Set[tuple] = set()
         self.job_history: List[ScrapingResult] = []
         self.max_concurrent_scrapers = 3
-        
+        # Wall-clock budget per source; one hung site must not hold the
+        # whole job open
+        self.source_timeout = 120.0
+        self._scrape_semaphore = asyncio.Semaphore(self.max_concurrent_scrapers)
+        # Recently scraped results per (source, query, location); a
+        # repeat job inside the TTL reuses them instead of re-hitting
+        # the site for listings that cannot have changed yet
+        self.result_cache_ttl = 90.0
+        self._result_cache: Dict[tuple, tuple] = {}
+        # Aggregates maintained as jobs complete, so the stats call
+        # never has to re-walk the whole job history
+        self._source_totals: Counter = Counter()
+        self._total_vehicles = 0
+        self._total_duration = 0.0
+
     async def initialize_scrapers(self):
         """Initialize all available scrapers"""
+        # Writes upsert on URL; the sparse unique index makes that an
+        # indexed lookup and stops concurrent jobs racing in duplicates
+        try:
+            await self.db.vehicles.create_index("url", unique=True, sparse=True)
+        except Exception as e:
+            logger.warning(f"Could not ensure vehicles url index: {e}")
+
         scraper_classes = {
             # Major Retail Platforms
             Source.AUTOTRADER: AutoTraderScraper,
@@ -124,13 +159,17 @@ class ScrapingManager:
     
     async def scrape_vehicles(self, job: ScrapingJob) -> ScrapingResult:
         """Execute a scraping job across multiple sources"""
-        job_id = f"{job.query}_{job.location}_{job.created_at.timestamp()}"
+        # Tuple key: hashes directly without building an id string, and
+        # cannot collide when query/location themselves contain '_'
+        job_id = (job.query, job.location, job.created_at)
         
         if job_id in self.active_jobs:
             raise ValueError(f"Job {job_id} is already running")
         
         self.active_jobs.add(job_id)
-        start_time = datetime.utcnow()
+        # Monotonic clock for the duration; wall-clock datetimes can
+        # jump under NTP adjustment and cost a syscall per read
+        start_time = time.perf_counter()
         
         try:
             logger.info(f"Starting scraping job: {job.query} in {job.location or 'all locations'}")
@@ -144,14 +183,8 @@ class ScrapingManager:
                 else:
                     logger.warning(f"Scraper for {source.value} not available")
             
-            # Execute scraping tasks with concurrency limit
-            semaphore = asyncio.Semaphore(self.max_concurrent_scrapers)
-            
-            async def limited_scrape(task):
-                async with semaphore:
-                    return await task
-            
-            results = await asyncio.gather(*[limited_scrape(task) for task in tasks], return_exceptions=True)
+            # Concurrency limiting and timeouts live in _scrape_source
+            results = await asyncio.gather(*tasks, return_exceptions=True)
             
             # Process results
             all_vehicles = []
@@ -177,7 +210,7 @@ class ScrapingManager:
             # Store results in database
             stored_count = await self._store_vehicles(unique_vehicles)
             
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             completed_at = datetime.utcnow()
             
             result = ScrapingResult(
@@ -190,6 +223,10 @@ class ScrapingManager:
             )
             
             self.job_history.append(result)
+            self._total_vehicles += len(unique_vehicles)
+            self._total_duration += duration
+            for source, count in source_results.items():
+                self._source_totals[source.value] += count
             
             logger.info(f"Scraping job completed: {len(unique_vehicles)} unique vehicles found, "
                        f"{stored_count} stored in database, took {duration:.2f}s")
@@ -203,16 +240,31 @@ class ScrapingManager:
         """Scrape vehicles from a single source"""
         scraper = self.scrapers[source]
         error = None
-        
+
+        cache_key = (source, job.query, job.location)
+        cached = self._result_cache.get(cache_key)
+        if cached and time.monotonic() - cached[1] < self.result_cache_ttl:
+            logger.info(f"Using cached results for {source.value}")
+            return cached[0], error
+
         try:
-            vehicles = await scraper.scrape_search_results(
-                query=job.query,
-                location=job.location,
-                max_results=job.max_results_per_source
-            )
+            async with self._scrape_semaphore:
+                vehicles = await asyncio.wait_for(
+                    scraper.scrape_search_results(
+                        query=job.query,
+                        location=job.location,
+                        max_results=job.max_results_per_source
+                    ),
+                    timeout=self.source_timeout
+                )
             logger.info(f"Scraped {len(vehicles)} vehicles from {source.value}")
+            self._result_cache[cache_key] = (vehicles, time.monotonic())
             return vehicles, error
-            
+
+        except asyncio.TimeoutError:
+            error = f"timed out after {self.source_timeout:.0f}s"
+            logger.error(f"Scraping {source.value} {error}")
+            return [], error
         except Exception as e:
             error = str(e)
             logger.error(f"Error scraping {source.value}: {e}")
@@ -220,65 +272,84 @@ class ScrapingManager:
     
     def _deduplicate_vehicles(self, vehicles: List[VehicleData]) -> List[VehicleData]:
         """Remove duplicate vehicles based on URL and VIN"""
-        seen_urls = set()
-        seen_vins = set()
+        # One shared seen-set: URLs and VINs live in disjoint keyspaces,
+        # so a single set halves the lookups per vehicle. The cheap
+        # essential-data check runs first so discarded rows never touch it.
+        seen = set()
         unique_vehicles = []
-        
+
         for vehicle in vehicles:
-            # Skip if we've seen this URL before
-            if vehicle.url and vehicle.url in seen_urls:
-                continue
-            
-            # Skip if we've seen this VIN before (and VIN exists)
-            if vehicle.vin and vehicle.vin in seen_vins:
-                continue
-            
             # Skip if essential data is missing
             if not vehicle.asking_price or not vehicle.make or not vehicle.model:
                 continue
-            
+
+            # Skip if we've seen this URL or VIN before
+            if vehicle.url and vehicle.url in seen:
+                continue
+            if vehicle.vin and vehicle.vin in seen:
+                continue
+
             if vehicle.url:
-                seen_urls.add(vehicle.url)
+                seen.add(vehicle.url)
             if vehicle.vin:
-                seen_vins.add(vehicle.vin)
-                
+                seen.add(vehicle.vin)
+
             unique_vehicles.append(vehicle)
         
-        logger.info(f"Deduplicated {len(vehicles)} vehicles to {len(unique_vehicles)} unique vehicles")
+        logger.info("Deduplicated %d vehicles to %d unique vehicles",
+                    len(vehicles), len(unique_vehicles))
         return unique_vehicles
     
     async def _store_vehicles(self, vehicles: List[VehicleData]) -> int:
         """Store vehicles in database"""
-        stored_count = 0
-        
+        # Convert the whole batch first so market metrics can be computed
+        # vectorized instead of per vehicle
+        converted = []
         for vehicle_data in vehicles:
             try:
-                # Convert to Vehicle model
-                vehicle_dict = vehicle_data.to_dict()
-                vehicle = Vehicle(**vehicle_dict)
-                
-                # Calculate market metrics
-                vehicle = calculate_market_metrics(vehicle)
-                
-                # Check if vehicle already exists (by URL)
-                existing = await self.db.vehicles.find_one({"url": vehicle.url})
-                if existing:
-                    # Update existing vehicle
-                    await self.db.vehicles.update_one(
-                        {"url": vehicle.url},
-                        {"$set": vehicle.dict()}
-                    )
-                else:
-                    # Insert new vehicle
-                    await self.db.vehicles.insert_one(vehicle.dict())
-                    stored_count += 1
-                    
+                converted.append(Vehicle(**vehicle_data.to_dict()))
             except Exception as e:
-                logger.error(f"Error storing vehicle: {e}")
-                continue
-        
-        return stored_count
+                logger.error(f"Error converting vehicle: {e}")
+        calculate_market_metrics_batch(converted)
+
+        if not converted:
+            return 0
+
+        # One unordered bulk round-trip replaces the find_one plus
+        # update/insert pair per vehicle; upserting on URL keeps the
+        # old update-or-insert semantics
+        payloads = await asyncio.to_thread(self._build_payloads, converted)
+
+        # Skip documents whose URL this process already upserted; a
+        # repeat job within the session re-writes nothing
+        global _stored_listing_urls
+        if len(_stored_listing_urls) > _STORED_URLS_MAX:
+            _stored_listing_urls = set()
+        payloads = [payload for payload in payloads
+                    if payload["url"] not in _stored_listing_urls]
+        if not payloads:
+            return 0
+
+        operations = [
+            UpdateOne({"url": payload["url"]}, {"$set": payload}, upsert=True)
+            for payload in payloads
+        ]
+        try:
+            result = await self.db.vehicles.bulk_write(operations, ordered=False)
+            _stored_listing_urls.update(payload["url"] for payload in payloads)
+            return result.upserted_count
+        except Exception as e:
+            logger.error(f"Error storing vehicles: {e}")
+            return 0
     
+    def _build_payloads(self, vehicles: List[Vehicle]) -> List[Dict]:
+        """Serialize converted vehicles for the bulk write
+
+        Each document is built exactly once here; everything downstream
+        (filter, $set) reuses the same dict instead of re-serializing.
+        """
+        return [add_normalized_fields(vehicle.dict()) for vehicle in vehicles]
+
     async def test_all_scrapers(self) -> Dict[Source, bool]:
         """Test all scrapers to see which are working"""
         results = {}
@@ -299,19 +370,11 @@ class ScrapingManager:
         if not self.job_history:
             return {"total_jobs": 0, "total_vehicles": 0, "avg_duration": 0}
         
-        total_vehicles = sum(len(result.vehicles) for result in self.job_history)
-        avg_duration = sum(result.duration for result in self.job_history) / len(self.job_history)
-        
-        source_stats = defaultdict(int)
-        for result in self.job_history:
-            for source, count in result.source_results.items():
-                source_stats[source.value] += count
-        
         return {
             "total_jobs": len(self.job_history),
-            "total_vehicles": total_vehicles,
-            "avg_duration": round(avg_duration, 2),
+            "total_vehicles": self._total_vehicles,
+            "avg_duration": round(self._total_duration / len(self.job_history), 2),
             "active_jobs": len(self.active_jobs),
-            "source_stats": dict(source_stats),
+            "source_stats": dict(self._source_totals),
             "last_job": self.job_history[-1].completed_at.isoformat() if self.job_history else None
         }
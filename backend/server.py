@@ -1,32 +1,64 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Query, BackgroundTasks
+from fastapi import FastAPI, APIRouter, HTTPException, Query, BackgroundTasks, Response
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient, ReturnDocument
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
 import asyncio
+import base64
+import binascii
+import functools
+import hashlib
 import random
+import re
+import time
+
+import numpy as np
+import orjson
+import redis.asyncio as aioredis
 
 # Import scraping system
 from .scrapers.scraping_manager import ScrapingManager, ScrapingJob
-from .models import Source, SellerType, ListingStatus, Vehicle, calculate_market_metrics
+from .models import (
+    Source, SellerType, ListingStatus, Vehicle,
+    add_normalized_fields, calculate_market_metrics,
+    calculate_market_metrics_batch_dicts
+)
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# MongoDB connection. Pool sizes are env-tunable so deployments can
+# raise concurrency without code changes; the driver defaults queue
+# requests well before the server is saturated
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncMongoClient(
+    mongo_url,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', '200')),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', '20')),
+    maxIdleTimeMS=30000,
+    waitQueueTimeoutMS=2000,
+    serverSelectionTimeoutMS=3000,
+    retryWrites=True,
+    compressors=os.environ.get('MONGO_COMPRESSORS', 'zstd,snappy'),
+)
 db = client[os.environ['DB_NAME']]
 
 # Create the main app without a prefix
-app = FastAPI(title="FlipBot AI - Premium Vehicle Intelligence", version="1.0.0")
+# orjson serializes the datetime-heavy vehicle lists in C instead of
+# the default pure-Python json.dumps path
+app = FastAPI(
+    title="FlipBot AI - Premium Vehicle Intelligence",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -34,9 +66,133 @@ api_router = APIRouter(prefix="/api")
 # Initialize scraping manager
 scraping_manager = None
 
+# Optional Redis cache shared across workers; without REDIS_URL (or
+# with Redis down) the endpoints fall back to the in-process TTL cache
+redis_client = None
+
+async def redis_cache_get(key: str):
+    """Fetch and decode a cached payload, or None"""
+    if redis_client is None:
+        return None
+    try:
+        cached = await redis_client.get(key)
+    except Exception as e:
+        logger.debug(f"Redis get failed for {key}: {e}")
+        return None
+    return orjson.loads(cached) if cached else None
+
+async def redis_cache_put(key: str, value, ttl: int):
+    """Store a payload with a TTL; best-effort"""
+    if redis_client is not None:
+        try:
+            await redis_client.set(key, orjson.dumps(value, default=str), ex=ttl)
+        except Exception as e:
+            logger.debug(f"Redis set failed for {key}: {e}")
+    return value
+
+async def redis_cache_delete(*keys: str):
+    """Drop cached payloads after a write; best-effort"""
+    if redis_client is not None:
+        try:
+            await redis_client.delete(*keys)
+        except Exception as e:
+            logger.debug(f"Redis delete failed: {e}")
+
+# Listing reads are cached under a versioned namespace; bumping the
+# version key on writes invalidates every cached page at once without
+# a SCAN over the keyspace
+_VEHICLES_CACHE_VERSION_KEY = "vehicles:ver"
+
+async def vehicles_cache_key(name: str, params: tuple) -> Optional[str]:
+    """Build a versioned cache key for a listing read, or None to skip"""
+    if redis_client is None:
+        return None
+    try:
+        version = await redis_client.get(_VEHICLES_CACHE_VERSION_KEY) or b"0"
+    except Exception as e:
+        logger.debug(f"Redis version lookup failed: {e}")
+        return None
+    if isinstance(version, bytes):
+        version = version.decode()
+    digest = hashlib.sha1(repr(params).encode()).hexdigest()
+    return f"vehicles:{version}:{name}:{digest}"
+
+async def bump_vehicles_cache():
+    """Invalidate all cached listing reads after a write; best-effort"""
+    if redis_client is not None:
+        try:
+            await redis_client.incr(_VEHICLES_CACHE_VERSION_KEY)
+        except Exception as e:
+            logger.debug(f"Redis version bump failed: {e}")
+
+async def ensure_indexes():
+    """Create the indexes the query endpoints rely on"""
+    # Text index backs /search; the unanchored case-insensitive regexes
+    # it replaces forced a full collection scan per request
+    await db.vehicles.create_index(
+        [("make", "text"), ("model", "text"), ("trim", "text")],
+        name="make_model_trim_text"
+    )
+    # Compound index for the structured make/model/year filter path
+    await db.vehicles.create_index([("make", 1), ("model", 1), ("year", 1)])
+    # Keyset pagination over /vehicles sorts on (flip_score, id)
+    await db.vehicles.create_index([("flip_score", -1), ("id", 1)])
+    # /deals filters on est_profit/roi_percent and sorts on flip_score;
+    # this index serves the range filters and avoids the in-memory sort
+    await db.vehicles.create_index(
+        [("est_profit", -1), ("roi_percent", -1), ("flip_score", -1)])
+    # Structured /vehicles filters
+    await db.vehicles.create_index(
+        [("status", 1), ("asking_price", 1), ("year", 1)])
+    # zip + price range queries; the zip_code prefix also serves the
+    # plain zip_code equality filter
+    await db.vehicles.create_index([("zip_code", 1), ("asking_price", 1)])
+    # Status-scoped deal listings
+    await db.vehicles.create_index([("status", 1), ("est_profit", -1)])
+    # Normalized lowercase fields queried with anchored prefix regexes
+    await db.vehicles.create_index([("make_lc", 1), ("model_lc", 1)])
+    # Single-vehicle lookups go through the application-level id, not
+    # _id, so they need their own unique index
+    await db.vehicles.create_index("id", unique=True)
+
+async def backfill_normalized_fields():
+    """Add make_lc/model_lc to documents written before those fields existed
+
+    The /vehicles filters query the normalized fields, so without this
+    one-time backfill older documents would silently drop out of
+    filtered results until re-upserted.
+    """
+    result = await db.vehicles.update_many(
+        {"make_lc": {"$exists": False}},
+        [{"$set": {
+            "make_lc": {"$toLower": "$make"},
+            "model_lc": {"$toLower": "$model"}
+        }}]
+    )
+    if result.modified_count:
+        logger.info(f"Backfilled normalized fields on {result.modified_count} vehicles")
+
 @app.on_event("startup")
 async def startup_event():
-    global scraping_manager
+    global scraping_manager, redis_client
+    configure_logging()
+    redis_url = os.environ.get('REDIS_URL')
+    if redis_url:
+        try:
+            redis_client = aioredis.from_url(redis_url)
+            await redis_client.ping()
+            logger.info("Redis cache connected")
+        except Exception as e:
+            logger.warning(f"Redis unavailable, using in-process cache only: {e}")
+            redis_client = None
+    try:
+        # Touch the server so the pool opens its minPoolSize connections
+        # now instead of on the first real request after deploy
+        await db.command("ping")
+        await backfill_normalized_fields()
+        await ensure_indexes()
+    except Exception as e:
+        logger.warning(f"Could not reach MongoDB during warmup: {e}")
     scraping_manager = ScrapingManager(db)
     try:
         await scraping_manager.initialize_scrapers()
@@ -49,7 +205,9 @@ async def shutdown_event():
     global scraping_manager
     if scraping_manager:
         await scraping_manager.cleanup_scrapers()
-    client.close()
+    if redis_client is not None:
+        await redis_client.aclose()
+    await client.close()
 
 # Enums for vehicle data
 
@@ -116,25 +274,126 @@ class ScrapingJobResponse(BaseModel):
     source_results: Optional[Dict[str, int]] = None
     categories_used: Optional[List[str]] = None
 
+# List endpoints feed summary cards; the image array, free-text notes
+# and internal bookkeeping fields never reach the UI, so leave them on
+# the server instead of shipping them in every document
+_LIST_PROJECTION = {
+    "_id": 0,
+    "images": 0,
+    "notes": 0,
+    "scraped_at": 0,
+    "make_lc": 0,
+    "model_lc": 0
+}
+
+@functools.lru_cache(maxsize=256)
+def prefix_regex(value: str) -> Dict:
+    """Memoized anchored prefix filter for a normalized field
+
+    The same handful of make/model filters repeat across requests;
+    caching skips re-escaping and the dict allocation, and sending an
+    identical pattern keeps the server-side regex cache warm.
+    """
+    return {"$regex": f"^{re.escape(value.lower())}"}
+
+def range_filter(low, high) -> Dict:
+    """Build a $gte/$lte bound dict, dropping unset ends"""
+    bounds = {}
+    if low:
+        bounds["$gte"] = low
+    if high:
+        bounds["$lte"] = high
+    return bounds
+
+def build_vehicle_query(
+    make=None, model=None, year_min=None, year_max=None,
+    price_min=None, price_max=None, zip_code=None,
+    min_profit=None, status=None
+) -> Dict:
+    """Build the Mongo filter for /vehicles from request params"""
+    query = {}
+
+    # Case-sensitive anchored prefix regex against the normalized
+    # lowercase fields; Mongo bounds the index scan to the prefix range,
+    # which an "i"-flagged or unanchored regex cannot do
+    if make:
+        query["make_lc"] = prefix_regex(make)
+    if model:
+        query["model_lc"] = prefix_regex(model)
+
+    year_range = range_filter(year_min, year_max)
+    if year_range:
+        query["year"] = year_range
+    price_range = range_filter(price_min, price_max)
+    if price_range:
+        query["asking_price"] = price_range
+
+    if zip_code:
+        query["zip_code"] = zip_code
+    if min_profit:
+        query["est_profit"] = {"$gte": min_profit}
+    if status:
+        query["status"] = status
+
+    return query
+
+# Keyset pagination tokens: the last-seen (flip_score, id) pair,
+# base64-encoded so clients treat it as opaque
+def encode_cursor(doc: Dict) -> str:
+    token = f"{doc.get('flip_score') or 0}|{doc.get('id', '')}"
+    return base64.urlsafe_b64encode(token.encode()).decode()
+
+def decode_cursor(cursor: str) -> tuple:
+    raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    score, _, last_id = raw.partition('|')
+    return float(score), last_id
+
+# In-process TTL cache for the hottest read endpoints; /deals and
+# /stats serve slowly-changing aggregates, so repeat hits within the
+# window skip the DB round-trip entirely
+_endpoint_cache: Dict[tuple, tuple] = {}
+
+def cache_get(key: tuple, ttl: float):
+    """Return the cached value for key if it is younger than ttl"""
+    entry = _endpoint_cache.get(key)
+    if entry and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+def cache_put(key: tuple, value):
+    """Store value in the endpoint cache under key"""
+    _endpoint_cache[key] = (time.monotonic(), value)
+    return value
+
+def cache_pop(key: tuple):
+    """Drop a cached entry; writes call this to stay coherent"""
+    _endpoint_cache.pop(key, None)
+
+# Shared NumPy generator for batch draws in mock-data generation
+_rng = np.random.default_rng()
+
 # Helper Functions
-def process_scraped_vehicle(vehicle_data):
-    """Convert VehicleData to dict with calculated metrics"""
+def process_scraped_vehicles(vehicle_datas):
+    """Convert a batch of VehicleData to dicts with calculated metrics
+
+    One vectorized metric pass over the whole batch replaces a Python
+    loop of per-vehicle calculate_market_metrics calls.
+    """
+    docs = [vehicle_data.to_dict() for vehicle_data in vehicle_datas]
     try:
-        # Convert to Vehicle model for calculations
-        vehicle_dict = vehicle_data.to_dict()
-        vehicle = Vehicle(**vehicle_dict)
-        
-        # Calculate market metrics
-        vehicle = calculate_market_metrics(vehicle)
-        
-        return vehicle.dict()
+        return calculate_market_metrics_batch_dicts(docs)
     except Exception as e:
-        logger.error(f"Error processing vehicle: {e}")
-        # Return basic dict if calculations fail
-        return vehicle_data.to_dict()
+        logger.error(f"Error processing scraped vehicle batch: {e}")
+        # Return the basic dicts if calculations fail
+        return docs
 
-async def generate_mock_vehicles():
-    """Generate mock vehicle data for demonstration"""
+def generate_mock_vehicles():
+    """Generate mock vehicle documents for demonstration
+
+    Returns insert-ready dicts; validating freshly generated data
+    through Vehicle models would only re-check what we just built.
+    Synchronous so callers can run it on a worker thread.
+    """
     makes_models = [
         ("Porsche", "911", ["Carrera", "Turbo", "GT3"]),
         ("BMW", "M3", ["Competition", "CS"]),
@@ -163,43 +422,87 @@ async def generate_mock_vehicles():
     
     sources = list(Source)
     seller_types = list(SellerType)
-    
-    vehicles = []
-    for _ in range(50):
-        make, model, trims = random.choice(makes_models)
-        location, zip_code = random.choice(locations)
-        
-        vehicle_data = {
+
+    n = 50
+    # Draw everything for the batch up front — one C-level rng call per
+    # column instead of several Python-level random calls per vehicle
+    mm_idx = _rng.integers(0, len(makes_models), n)
+    loc_idx = _rng.integers(0, len(locations), n)
+    trim_pick = _rng.random(n)
+    seller_idx = _rng.integers(0, len(seller_types), n)
+    source_idx = _rng.integers(0, len(sources), n)
+    years = _rng.integers(2018, 2025, n)
+    miles = _rng.integers(5000, 80001, n)
+    prices = _rng.integers(30000, 200001, n)
+    days = _rng.integers(1, 31, n)
+    tc_mask = _rng.random(n) > 0.5
+    tc_vals = _rng.integers(500, 2001, n)
+
+    now = datetime.utcnow()
+    # One vectorized subtraction yields all the listing dates; the
+    # datetime64[us] round-trip hands back plain datetimes for BSON
+    listed_dates = (np.datetime64(now) - days.astype('timedelta64[D]')
+                    ).astype('datetime64[us]').tolist()
+
+    rows = []
+    for i in range(n):
+        make, model, trims = makes_models[mm_idx[i]]
+        location, zip_code = locations[loc_idx[i]]
+
+        rows.append({
+            "id": str(uuid.uuid4()),
+            "vin": None,
             "make": make,
             "model": model,
-            "trim": random.choice(trims),
-            "year": random.randint(2018, 2024),
-            "mileage": random.randint(5000, 80000),
-            "asking_price": random.randint(30000, 200000),
+            "trim": trims[int(trim_pick[i] * len(trims))],
+            "year": int(years[i]),
+            "mileage": int(miles[i]),
+            "asking_price": int(prices[i]),
             "location": location,
             "zip_code": zip_code,
-            "seller_type": random.choice(seller_types),
-            "source": random.choice(sources),
+            "seller_type": seller_types[seller_idx[i]],
+            "source": sources[source_idx[i]],
             "url": f"https://example.com/listing/{uuid.uuid4()}",
-            "date_listed": datetime.utcnow() - timedelta(days=random.randint(1, 30)),
-            "transport_cost": random.randint(500, 2000) if random.random() > 0.5 else None
-        }
-        
-        vehicle = Vehicle(**vehicle_data)
-        vehicle = calculate_market_metrics(vehicle)
-        vehicles.append(vehicle)
-    
-    return vehicles
+            "date_listed": listed_dates[i],
+            "scraped_at": now,
+            "transport_cost": int(tc_vals[i]) if tc_mask[i] else None,
+            "distance_miles": None,
+            "status": ListingStatus.NEW,
+            "notes": None,
+            "images": []
+        })
+
+    # Market metrics for the whole batch in a handful of NumPy ufunc
+    # calls instead of a per-vehicle calculate_market_metrics pass
+    asking = np.array([row["asking_price"] for row in rows], dtype=np.float64)
+    transport = np.array([row["transport_cost"] or 0 for row in rows],
+                         dtype=np.float64)
+    market = np.round(asking * _rng.uniform(0.9, 1.3, len(rows)), 2)
+    profit = market - asking - transport
+    roi = np.where(asking > 0, profit / asking * 100.0, 0.0)
+    flip = np.round(np.clip(profit / 5000.0, 0.0, 5.0)
+                    + np.clip(roi / 10.0, 0.0, 5.0), 1)
+
+    for i, row in enumerate(rows):
+        row["market_value"] = float(market[i])
+        row["est_profit"] = float(profit[i])
+        row["roi_percent"] = float(roi[i])
+        row["flip_score"] = float(flip[i])
+        add_normalized_fields(row)
+
+    return rows
 
 # API Routes
 @api_router.get("/")
 async def root():
     return {"message": "FlipBot AI - Premium Vehicle Intelligence Platform"}
 
-@api_router.get("/vehicles", response_model=List[Vehicle])
+@api_router.get("/vehicles", response_model=None)
 async def get_vehicles(
+    response: Response,
     skip: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
     make: Optional[str] = None,
     model: Optional[str] = None,
     year_min: Optional[int] = None,
@@ -212,68 +515,108 @@ async def get_vehicles(
     status: Optional[ListingStatus] = None
 ):
     """Get vehicles with optional filtering"""
-    query = {}
-    
-    if make:
-        query["make"] = {"$regex": make, "$options": "i"}
-    if model:
-        query["model"] = {"$regex": model, "$options": "i"}
-    if year_min:
-        query["year"] = {"$gte": year_min}
-    if year_max:
-        if "year" in query:
-            query["year"]["$lte"] = year_max
-        else:
-            query["year"] = {"$lte": year_max}
-    if price_min:
-        query["asking_price"] = {"$gte": price_min}
-    if price_max:
-        if "asking_price" in query:
-            query["asking_price"]["$lte"] = price_max
-        else:
-            query["asking_price"] = {"$lte": price_max}
-    if zip_code:
-        query["zip_code"] = zip_code
-    if min_profit:
-        query["est_profit"] = {"$gte": min_profit}
-    if status:
-        query["status"] = status
-    
-    vehicles = await db.vehicles.find(query).skip(skip).limit(limit).to_list(None)
-    return [Vehicle(**vehicle) for vehicle in vehicles]
+    # Identical filter/page combinations repeat heavily during
+    # pagination and polling; serve them from Redis for a short window.
+    # Large pages are left uncached to keep blob sizes bounded.
+    cache_key = None
+    if limit <= 100:
+        cache_key = await vehicles_cache_key(
+            "list", (skip, limit, cursor, make, model, year_min, year_max,
+                     price_min, price_max, zip_code, min_profit, status))
+    if cache_key:
+        cached = await redis_cache_get(cache_key)
+        if cached is not None:
+            if cached.get("next"):
+                response.headers["X-Next-Cursor"] = cached["next"]
+            return cached["items"]
+
+    query = build_vehicle_query(
+        make=make, model=model, year_min=year_min, year_max=year_max,
+        price_min=price_min, price_max=price_max, zip_code=zip_code,
+        min_profit=min_profit, status=status
+    )
+
+
+    # Keyset pagination: resume after the cursor's (flip_score, id)
+    # position so page cost is O(limit) at any depth, where skip() must
+    # walk and discard every earlier document. skip remains as the
+    # legacy path for clients that have not adopted cursors yet.
+    if cursor:
+        try:
+            last_score, last_id = decode_cursor(cursor)
+        except (ValueError, binascii.Error):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query["$or"] = [
+            {"flip_score": {"$lt": last_score}},
+            {"flip_score": last_score, "id": {"$gt": last_id}}
+        ]
+        results = db.vehicles.find(query, _LIST_PROJECTION)
+    else:
+        results = db.vehicles.find(query, _LIST_PROJECTION).skip(skip)
+
+    # Serve the stored documents directly; re-validating data we wrote
+    # ourselves through Vehicle(**doc) adds a full Pydantic pass per
+    # item with no semantic value on the read path
+    vehicles = await results.sort(
+        [("flip_score", -1), ("id", 1)]).limit(limit).to_list(limit)
+    next_cursor = encode_cursor(vehicles[-1]) if vehicles else None
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if cache_key:
+        await redis_cache_put(
+            cache_key, {"items": vehicles, "next": next_cursor}, ttl=20)
+    return vehicles
 
 @api_router.post("/vehicles", response_model=Vehicle)
 async def create_vehicle(vehicle_data: VehicleCreate):
     """Create a new vehicle listing"""
-    vehicle = Vehicle(**vehicle_data.dict())
-    vehicle = calculate_market_metrics(vehicle)
-    
-    await db.vehicles.insert_one(vehicle.dict())
+    # Metrics run on the plain dict; the Vehicle is constructed once at
+    # the boundary, where it fills the id/scraped_at/status defaults
+    vehicle = Vehicle(**calculate_market_metrics(vehicle_data.dict()))
+
+    await db.vehicles.insert_one(add_normalized_fields(vehicle.dict()))
+    cache_pop(("stats",))
+    await redis_cache_delete("stats:v1")
+    await bump_vehicles_cache()
     return vehicle
 
 @api_router.get("/vehicles/{vehicle_id}", response_model=Vehicle)
 async def get_vehicle(vehicle_id: str):
     """Get a specific vehicle by ID"""
-    vehicle = await db.vehicles.find_one({"id": vehicle_id})
+    # Detail pages poll a handful of hot ids; the read-through cache
+    # serves repeats from memory and writes invalidate on change
+    cache_key = ("vehicle", vehicle_id)
+    cached = cache_get(cache_key, ttl=60.0)
+    if cached is not None:
+        return cached
+
+    vehicle = await db.vehicles.find_one(
+        {"id": vehicle_id}, {"_id": 0, "make_lc": 0, "model_lc": 0})
     if not vehicle:
         raise HTTPException(status_code=404, detail="Vehicle not found")
-    return Vehicle(**vehicle)
+    # construct() skips re-validating a document we validated on write
+    return cache_put(cache_key, Vehicle.construct(**vehicle))
 
 @api_router.put("/vehicles/{vehicle_id}", response_model=Vehicle)
 async def update_vehicle(vehicle_id: str, updates: VehicleUpdate):
     """Update a vehicle listing"""
     update_data = {k: v for k, v in updates.dict().items() if v is not None}
-    
-    result = await db.vehicles.update_one(
+
+    # One round-trip: apply the update and get the new document back
+    # instead of an update_one followed by a find_one
+    vehicle = await db.vehicles.find_one_and_update(
         {"id": vehicle_id},
-        {"$set": update_data}
+        {"$set": update_data},
+        projection={"_id": 0, "make_lc": 0, "model_lc": 0},
+        return_document=ReturnDocument.AFTER
     )
-    
-    if result.matched_count == 0:
+
+    if vehicle is None:
         raise HTTPException(status_code=404, detail="Vehicle not found")
-    
-    vehicle = await db.vehicles.find_one({"id": vehicle_id})
-    return Vehicle(**vehicle)
+
+    cache_pop(("vehicle", vehicle_id))
+    await bump_vehicles_cache()
+    return Vehicle.construct(**vehicle)
 
 @api_router.delete("/vehicles/{vehicle_id}")
 async def delete_vehicle(vehicle_id: str):
@@ -281,36 +624,48 @@ async def delete_vehicle(vehicle_id: str):
     result = await db.vehicles.delete_one({"id": vehicle_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Vehicle not found")
+    cache_pop(("vehicle", vehicle_id))
+    cache_pop(("stats",))
+    await redis_cache_delete("stats:v1")
+    await bump_vehicles_cache()
     return {"message": "Vehicle deleted successfully"}
 
-@api_router.get("/deals", response_model=List[Vehicle])
+@api_router.get("/deals", response_model=None)
 async def get_deals(
     min_profit: float = 5000,
     min_roi: float = 10,
     limit: int = 20
 ):
     """Get top deal opportunities based on profit and ROI"""
+    cache_key = ("deals", min_profit, min_roi, limit)
+    cached = cache_get(cache_key, ttl=30.0)
+    if cached is not None:
+        return cached
+
     query = {
         "est_profit": {"$gte": min_profit},
         "roi_percent": {"$gte": min_roi}
     }
-    
-    vehicles = await db.vehicles.find(query).sort("flip_score", -1).limit(limit).to_list(None)
-    return [Vehicle(**vehicle) for vehicle in vehicles]
+
+    vehicles = await db.vehicles.find(
+        query, _LIST_PROJECTION).sort("flip_score", -1).limit(limit).to_list(limit)
+    return cache_put(cache_key, vehicles)
+
+# Mock trending data - in real app, this would analyze market trends.
+# Built once at import time so each request skips model construction
+_TRENDING = [
+    MarketTrend(make_model="Porsche 911", avg_price=95000, price_change_percent=4.2, total_listings=15),
+    MarketTrend(make_model="BMW M3", avg_price=72000, price_change_percent=3.1, total_listings=23),
+    MarketTrend(make_model="Corvette", avg_price=68000, price_change_percent=-1.4, total_listings=18),
+    MarketTrend(make_model="Tesla Model S", avg_price=85000, price_change_percent=2.8, total_listings=12),
+    MarketTrend(make_model="Ford Raptor", avg_price=58000, price_change_percent=5.7, total_listings=31),
+    MarketTrend(make_model="Mercedes AMG GT", avg_price=110000, price_change_percent=1.9, total_listings=8)
+]
 
 @api_router.get("/trending", response_model=List[MarketTrend])
 async def get_trending():
     """Get trending vehicle market data"""
-    # Mock trending data - in real app, this would analyze market trends
-    trending = [
-        MarketTrend(make_model="Porsche 911", avg_price=95000, price_change_percent=4.2, total_listings=15),
-        MarketTrend(make_model="BMW M3", avg_price=72000, price_change_percent=3.1, total_listings=23),
-        MarketTrend(make_model="Corvette", avg_price=68000, price_change_percent=-1.4, total_listings=18),
-        MarketTrend(make_model="Tesla Model S", avg_price=85000, price_change_percent=2.8, total_listings=12),
-        MarketTrend(make_model="Ford Raptor", avg_price=58000, price_change_percent=5.7, total_listings=31),
-        MarketTrend(make_model="Mercedes AMG GT", avg_price=110000, price_change_percent=1.9, total_listings=8)
-    ]
-    return trending
+    return _TRENDING
 
 @api_router.get("/search")
 async def search_vehicles(
@@ -321,66 +676,128 @@ async def search_vehicles(
     year_min: Optional[int] = None
 ):
     """Search vehicles by query string with location and filters"""
-    query = {
-        "$or": [
-            {"make": {"$regex": q, "$options": "i"}},
-            {"model": {"$regex": q, "$options": "i"}},
-            {"trim": {"$regex": q, "$options": "i"}}
-        ]
-    }
-    
+    cache_key = await vehicles_cache_key(
+        "search", (q, zip_code, distance, price_max, year_min))
+    if cache_key:
+        cached = await redis_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+    # $text runs against the make/model/trim text index created at
+    # startup; the previous $or of case-insensitive regexes scanned and
+    # regex-matched every document in the collection
+    query = {"$text": {"$search": q}}
+
     if zip_code:
         query["zip_code"] = zip_code
     if price_max:
         query["asking_price"] = {"$lte": price_max}
     if year_min:
         query["year"] = {"$gte": year_min}
-    
-    vehicles = await db.vehicles.find(query).limit(30).to_list(None)
-    return [Vehicle(**vehicle) for vehicle in vehicles]
+
+    vehicles = await db.vehicles.find(
+        query, {**_LIST_PROJECTION, "score": {"$meta": "textScore"}}
+    ).sort([("score", {"$meta": "textScore"})]).limit(30).to_list(30)
+    for vehicle in vehicles:
+        vehicle.pop("score", None)
+    if cache_key:
+        await redis_cache_put(cache_key, vehicles, ttl=20)
+    return vehicles
 
 @api_router.post("/initialize-data")
 async def initialize_mock_data():
     """Initialize the database with mock vehicle data"""
-    # Clear existing data
-    await db.vehicles.delete_many({})
-    
-    # Generate and insert mock data
-    mock_vehicles = await generate_mock_vehicles()
-    vehicle_dicts = [vehicle.dict() for vehicle in mock_vehicles]
-    
-    await db.vehicles.insert_many(vehicle_dicts)
-    
-    return {"message": f"Initialized {len(mock_vehicles)} mock vehicles"}
+    # Clear the old data server-side while generation runs on a worker
+    # thread; the two are independent
+    _, vehicle_dicts = await asyncio.gather(
+        db.vehicles.delete_many({}),
+        asyncio.to_thread(generate_mock_vehicles)
+    )
+
+    # Unordered inserts let the server apply the batch in parallel
+    # instead of one-at-a-time with abort-on-first-error; the documents
+    # are generated in-process, so server-side schema validation is
+    # redundant work
+    await db.vehicles.insert_many(
+        vehicle_dicts, ordered=False, bypass_document_validation=True)
+
+    cache_pop(("stats",))
+    await redis_cache_delete("stats:v1")
+    await bump_vehicles_cache()
+    return {"message": f"Initialized {len(vehicle_dicts)} mock vehicles"}
 
 @api_router.get("/stats")
 async def get_stats():
     """Get platform statistics"""
-    total_vehicles = await db.vehicles.count_documents({})
-    total_deals = await db.vehicles.count_documents({"est_profit": {"$gt": 5000}})
-    avg_profit = await db.vehicles.aggregate([
-        {"$match": {"est_profit": {"$gt": 0}}},
-        {"$group": {"_id": None, "avg_profit": {"$avg": "$est_profit"}}}
-    ]).to_list(1)
-    
-    return {
-        "total_vehicles": total_vehicles,
-        "deal_opportunities": total_deals,
+    cached = cache_get(("stats",), ttl=60.0)
+    if cached is not None:
+        return cached
+
+    # Second level: Redis, shared across workers so one of them
+    # computing the aggregate serves the rest
+    cached = await redis_cache_get("stats:v1")
+    if cached is not None:
+        return cache_put(("stats",), cached)
+
+    # One $facet aggregation computes all three figures in a single
+    # round-trip instead of two count_documents calls plus an aggregate
+    cursor = await db.vehicles.aggregate([
+        {"$facet": {
+            "total": [{"$count": "n"}],
+            "deals": [
+                {"$match": {"est_profit": {"$gt": 5000}}},
+                {"$count": "n"}
+            ],
+            "avg": [
+                {"$match": {"est_profit": {"$gt": 0}}},
+                {"$group": {"_id": None, "avg_profit": {"$avg": "$est_profit"}}}
+            ]
+        }}
+    ])
+    facets = await cursor.to_list(1)
+    stats = facets[0] if facets else {}
+    total = stats.get("total") or []
+    deals = stats.get("deals") or []
+    avg_profit = stats.get("avg") or []
+
+    stats = cache_put(("stats",), {
+        "total_vehicles": total[0]["n"] if total else 0,
+        "deal_opportunities": deals[0]["n"] if deals else 0,
         "avg_profit": round(avg_profit[0]["avg_profit"], 2) if avg_profit else 0,
         "sources_tracked": len(Source),
         "last_updated": datetime.utcnow()
-    }
+    })
+    return await redis_cache_put("stats:v1", stats, ttl=45)
 
 # ============== LIVE SCRAPING ENDPOINTS ==============
 
+# Status records for background scraping jobs, keyed by job_id and
+# polled via GET /scrape/jobs/{job_id}
+_scrape_jobs: Dict[str, Dict] = {}
+_SCRAPE_JOBS_MAX = 500
+
+async def run_scraping_job(job_id: str, job: ScrapingJob):
+    """Execute a scraping job and record its outcome for polling"""
+    try:
+        result = await scraping_manager.scrape_vehicles(job)
+        _scrape_jobs[job_id] = {
+            "status": "completed",
+            "vehicles_found": len(result.vehicles),
+            "duration": result.duration,
+            "source_results": {k.value: v for k, v in result.source_results.items()}
+        }
+    except Exception as e:
+        logger.error(f"Scraping job {job_id} failed: {e}")
+        _scrape_jobs[job_id] = {"status": "failed", "message": str(e)}
+
 @api_router.post("/scrape", response_model=ScrapingJobResponse)
 async def start_scraping(job_data: ScrapingJobCreate, background_tasks: BackgroundTasks):
     """Start a new vehicle scraping job"""
     global scraping_manager
-    
+
     if not scraping_manager:
         raise HTTPException(status_code=503, detail="Scraping system not available")
-    
+
     try:
         # Create scraping job
         job = ScrapingJob(
@@ -389,26 +806,40 @@ async def start_scraping(job_data: ScrapingJobCreate, background_tasks: Backgrou
             max_results_per_source=job_data.max_results_per_source or 20,
             sources=job_data.sources or [Source.AUTOTRADER, Source.CARS_COM, Source.CARGURUS, Source.CRAIGSLIST]
         )
-        
-        # Start scraping in background
+
         job_id = f"{job.query}_{job.location}_{job.created_at.timestamp()}"
-        
-        # For demo, run synchronously but in production this would be background
-        result = await scraping_manager.scrape_vehicles(job)
-        
+
+        # Run the scrape after the response is sent instead of holding
+        # the HTTP connection open for the whole multi-source crawl.
+        # When the table fills, drop the oldest finished entries only;
+        # running jobs must stay pollable until they complete
+        if len(_scrape_jobs) > _SCRAPE_JOBS_MAX:
+            for finished_id in [jid for jid, record in _scrape_jobs.items()
+                                if record.get("status") != "running"]:
+                del _scrape_jobs[finished_id]
+                if len(_scrape_jobs) <= _SCRAPE_JOBS_MAX // 2:
+                    break
+        _scrape_jobs[job_id] = {"status": "running"}
+        background_tasks.add_task(run_scraping_job, job_id, job)
+
         return ScrapingJobResponse(
             job_id=job_id,
-            status="completed",
-            message=f"Successfully scraped {len(result.vehicles)} vehicles",
-            vehicles_found=len(result.vehicles),
-            duration=result.duration,
-            source_results={k.value: v for k, v in result.source_results.items()}
+            status="queued",
+            message=f"Scraping job queued; poll /api/scrape/jobs/{job_id} for results"
         )
-        
+
     except Exception as e:
         logger.error(f"Scraping job failed: {e}")
         raise HTTPException(status_code=500, detail=f"Scraping failed: {str(e)}")
 
+@api_router.get("/scrape/jobs/{job_id}")
+async def get_scraping_job(job_id: str):
+    """Poll the status/result of a background scraping job"""
+    job = _scrape_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Scraping job not found")
+    return {"job_id": job_id, **job}
+
 @api_router.get("/scrape/test", response_model=Dict[str, bool])
 async def test_scrapers():
     """Test all scrapers to see which are working"""
@@ -457,13 +888,18 @@ async def quick_scrape(query: str, location: str = "", max_results: int = 10):
         )
         
         result = await scraping_manager.scrape_vehicles(job)
+
+        # Metric math for the response batch is synchronous CPU work;
+        # run it on a worker thread so the loop keeps serving requests
+        processed = await asyncio.to_thread(
+            process_scraped_vehicles, result.vehicles[:10])
         
         return {
             "query": query,
             "location": location,
             "vehicles_found": len(result.vehicles),
             "duration": result.duration,
-            "vehicles": [process_scraped_vehicle(vehicle) for vehicle in result.vehicles[:10]],
+            "vehicles": processed,
             "source_results": {k.value: v for k, v in result.source_results.items()}
         }
         
@@ -489,13 +925,18 @@ async def comprehensive_scrape(query: str, location: str = "", max_results: int
         )
         
         result = await scraping_manager.scrape_vehicles(job)
+
+        # Metric math for the response batch is synchronous CPU work;
+        # run it on a worker thread so the loop keeps serving requests
+        processed = await asyncio.to_thread(
+            process_scraped_vehicles, result.vehicles[:50])
         
         return {
             "query": query,
             "location": location,
             "vehicles_found": len(result.vehicles),
             "duration": result.duration,
-            "vehicles": [process_scraped_vehicle(vehicle) for vehicle in result.vehicles[:50]],
+            "vehicles": processed,
             "source_results": {k.value: v for k, v in result.source_results.items()},
             "categories_used": ["retail", "marketplace"]
         }
@@ -522,12 +963,17 @@ async def enthusiast_scrape(query: str, max_results: int = 15):
         )
         
         result = await scraping_manager.scrape_vehicles(job)
+
+        # Metric math for the response batch is synchronous CPU work;
+        # run it on a worker thread so the loop keeps serving requests
+        processed = await asyncio.to_thread(
+            process_scraped_vehicles, result.vehicles)
         
         return {
             "query": query,
             "vehicles_found": len(result.vehicles),
             "duration": result.duration,
-            "vehicles": [process_scraped_vehicle(vehicle) for vehicle in result.vehicles],
+            "vehicles": processed,
             "source_results": {k.value: v for k, v in result.source_results.items()},
             "categories_used": ["auction", "enthusiast"],
             "note": "Auction and enthusiast platform data - prices may reflect final sale values"
@@ -555,13 +1001,18 @@ async def private_party_scrape(query: str, location: str = "", max_results: int
         )
         
         result = await scraping_manager.scrape_vehicles(job)
+
+        # Metric math for the response batch is synchronous CPU work;
+        # run it on a worker thread so the loop keeps serving requests
+        processed = await asyncio.to_thread(
+            process_scraped_vehicles, result.vehicles)
         
         return {
             "query": query,
             "location": location,
             "vehicles_found": len(result.vehicles),
             "duration": result.duration,
-            "vehicles": [process_scraped_vehicle(vehicle) for vehicle in result.vehicles],
+            "vehicles": processed,
             "source_results": {k.value: v for k, v in result.source_results.items()},
             "categories_used": ["marketplace"],
             "note": "Private party listings - typically offer best profit margins"
@@ -617,21 +1068,25 @@ async def get_available_sources():
 # Include the router in the main app
 app.include_router(api_router)
 
+# Explicit origin/method/header lists let the middleware answer with
+# set membership instead of reflecting wildcards on every request
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=os.environ.get('ALLOWED_ORIGINS', '*').split(','),
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+def configure_logging():
+    """Configure the root logger once, at application startup"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
 logger = logging.getLogger(__name__)
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
+    await client.close()